@@ -1,33 +1,62 @@
 """Configuration loader for YAML config files."""
 
 import os
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+import orjson
 import yaml
 
+# libyaml's C loader is several times faster; fall back to pure Python
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+from .utils.cache import FileCache
 from .utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 class Config:
-    """Configuration manager for loading YAML config files."""
+    """
+    Configuration manager for loading YAML config files.
+
+    Files are read once in __init__, so derived settings are computed on
+    first access and cached for the lifetime of the instance.
+    """
+
+    # Entries are keyed on file mtime, so the TTL only bounds stale cache files
+    CACHE_TTL = 30 * 24 * 3600
 
-    def __init__(self, config_dir: str = "config"):
+    def __init__(self, config_dir: str = "config", cache_dir: str = "private/cache/config"):
         """
         Initialize config loader.
 
         Args:
             config_dir: Directory containing config YAML files
+            cache_dir: Directory for cached parsed configs
         """
         self.config_dir = Path(config_dir)
 
+        # Only needed while loading, so it is not kept on the instance
+        cache = self._open_cache(cache_dir)
+
         # Load all config files
-        self.sources = self._load_sources()
-        self.scoring_config = self._load_scoring_config()
-        self.tags_taxonomy = self._load_tags_taxonomy()
+        self.sources = self._load_sources(cache)
+        self.scoring_config = self._load_scoring_config(cache)
+        self.tags_taxonomy = self._load_tags_taxonomy(cache)
+
+    def _open_cache(self, cache_dir: str) -> Optional[FileCache]:
+        """Open the parsed-config cache, or None if it cannot be created."""
+        try:
+            return FileCache(cache_dir=cache_dir, ttl_seconds=self.CACHE_TTL)
+        except OSError as e:
+            logger.warning(f"Config cache unavailable, parsing YAML directly: {e}")
+            return None
 
-    def _load_yaml(self, filename: str) -> Dict[str, Any]:
+    def _load_yaml(self, filename: str, cache: Optional[FileCache] = None) -> Dict[str, Any]:
         """Load YAML file from config directory."""
         filepath = self.config_dir / filename
 
@@ -35,19 +64,47 @@ class Config:
             logger.warning(f"Config file not found: {filepath}")
             return {}
 
+        # Reuse the parsed result until the file changes; cache errors are misses
+        cache_key = f"{filepath.resolve()}:{filepath.stat().st_mtime_ns}"
+        if cache is not None:
+            try:
+                cached = cache.get(cache_key)
+            except OSError as e:
+                logger.warning(f"Failed to read cached config {filename}: {e}")
+                cached = None
+            if cached is not None:
+                logger.info(f"Loaded config: {filename} (cached)")
+                return cached
+
         try:
             with open(filepath, 'r') as f:
-                data = yaml.safe_load(f)
-                logger.info(f"Loaded config: {filename}")
-                return data or {}
+                data = yaml.load(f, Loader=SafeLoader) or {}
+            logger.info(f"Loaded config: {filename}")
         except yaml.YAMLError as e:
             logger.error(f"Failed to parse YAML {filename}: {e}")
             return {}
 
-    def _load_sources(self) -> List[Dict[str, Any]]:
+        if cache is not None and self._survives_json(data):
+            try:
+                cache.set(cache_key, data)
+            except OSError as e:
+                logger.warning(f"Failed to cache config {filename}: {e}")
+        return data
+
+    @staticmethod
+    def _survives_json(data: Any) -> bool:
+        """Check that a cache round trip returns the document unchanged."""
+        # Dates and non-string keys would come back as strings
+        try:
+            return orjson.loads(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)) == data
+        except TypeError:
+            return False
+
+    def _load_sources(self, cache: Optional[FileCache] = None) -> List[Dict[str, Any]]:
         """Load sources configuration."""
-        data = self._load_yaml("sources.yaml")
+        data = self._load_yaml("sources.yaml", cache)
         sources = data.get('sources', [])
+        self.fetch_settings = data.get('fetch', {}) or {}
 
         # Filter to enabled sources only
         enabled_sources = [s for s in sources if s.get('enabled', True)]
@@ -55,17 +112,46 @@ class Config:
 
         return enabled_sources
 
-    def _load_scoring_config(self) -> Dict[str, Any]:
+    def _load_scoring_config(self, cache: Optional[FileCache] = None) -> Dict[str, Any]:
         """Load scoring configuration."""
-        data = self._load_yaml("scoring_weights.yaml")
+        data = self._load_yaml("scoring_weights.yaml", cache)
         return data.get('scoring', {}) if 'scoring' in data else data
 
-    def _load_tags_taxonomy(self) -> Dict[str, Any]:
+    def _load_tags_taxonomy(self, cache: Optional[FileCache] = None) -> Dict[str, Any]:
         """Load tags taxonomy."""
-        data = self._load_yaml("tags_taxonomy.yaml")
+        data = self._load_yaml("tags_taxonomy.yaml", cache)
         return data.get('tags', {})
 
-    @property
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the loaded settings as plain data, e.g. for worker processes."""
+        return {
+            'config_dir': str(self.config_dir),
+            'sources': self.sources,
+            'fetch_settings': self.fetch_settings,
+            'scoring_config': self.scoring_config,
+            'tags_taxonomy': self.tags_taxonomy
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any]) -> 'Config':
+        """
+        Rebuild a config from snapshot() output without reading any files.
+
+        Args:
+            snapshot: Settings returned by snapshot()
+
+        Returns:
+            Configuration object
+        """
+        config = cls.__new__(cls)
+        config.config_dir = Path(snapshot['config_dir'])
+        config.sources = snapshot['sources']
+        config.fetch_settings = snapshot['fetch_settings']
+        config.scoring_config = snapshot['scoring_config']
+        config.tags_taxonomy = snapshot['tags_taxonomy']
+        return config
+
+    @cached_property
     def scoring_weights(self) -> Dict[str, float]:
         """Get scoring dimension weights."""
         dimensions = self.scoring_config.get('dimensions', {})
@@ -79,12 +165,28 @@ class Config:
             'practicality': 0.10
         }
 
-    @property
+    @cached_property
+    def sources_by_type(self) -> Dict[Optional[str], List[Dict[str, Any]]]:
+        """Get enabled sources grouped by source type (rss, arxiv, ...).
+
+        Sources without a type are grouped under None, which has no fetcher.
+        """
+        grouped: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        for source in self.sources:
+            grouped.setdefault(source.get('type'), []).append(source)
+        return grouped
+
+    @cached_property
+    def fetch_max_workers(self) -> int:
+        """Get maximum number of sources fetched concurrently."""
+        return int(self.fetch_settings.get('max_workers', 8))
+
+    @cached_property
     def relevance_keywords(self) -> Dict[str, Any]:
         """Get relevance keyword configuration."""
         return self.scoring_config.get('topical_relevance', {}).get('high_priority_topics', {})
 
-    @property
+    @cached_property
     def credibility_tiers(self) -> Dict[str, int]:
         """Get credibility tier scores."""
         tiers = self.scoring_config.get('credibility_tiers', {})
@@ -1,18 +1,71 @@
 """RSS feed fetcher using feedparser."""
 
-from typing import List, Dict, Any
+import threading
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
 import feedparser
 
 from .base_fetcher import BaseFetcher
+from ..utils.cache import FileCache
+from ..utils.http_client import SafeHTTPClient
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=2048)
+def _iso_from_struct(date_fields: Tuple[int, ...]) -> str:
+    """Convert (year, month, day, hour, minute, second) to an ISO string, memoized."""
+    return datetime(*date_fields).isoformat()
+
+
 class RSSFetcher(BaseFetcher):
     """Fetcher for RSS/Atom feeds."""
 
+    # Shared across fetchers so TCP/TLS connections are reused between sources
+    # Unreachable hosts fail on the short connect timeout instead of tying up a worker
+    http_client = SafeHTTPClient(timeout=15, pool_size=32, connect_timeout=5)
+
+    # Validators and parsed items are kept for a week; stale entries just refetch
+    FEED_CACHE_TTL = 7 * 24 * 3600
+
+    # Built on first use and shared, so the cache directory is listed once per
+    # run rather than once per source
+    _shared_cache: Optional[FileCache] = None
+    _shared_cache_lock = threading.Lock()
+
+    def __init__(self, source_config: Dict[str, Any] = None, cache: FileCache = None):
+        """
+        Initialize RSS fetcher.
+
+        Args:
+            source_config: Source configuration dict
+            cache: Cache for feed validators and parsed items (defaults to one
+                shared by all fetchers)
+        """
+        super().__init__(source_config)
+        self.source_url = self.source_config.get('url')
+        self.cache = cache or self._default_cache()
+
+    @classmethod
+    def _default_cache(cls) -> FileCache:
+        """Get the feed cache shared by fetchers built without one."""
+        # Fetchers are constructed concurrently by fetch_sources
+        with cls._shared_cache_lock:
+            if cls._shared_cache is None:
+                cls._shared_cache = FileCache(cache_dir="private/cache/feeds", ttl_seconds=cls.FEED_CACHE_TTL)
+            return cls._shared_cache
+
+    def _conditional_headers(self, cached: Dict[str, Any]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from a cached fetch."""
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+
     def fetch(self) -> List[Dict[str, Any]]:
         """
         Fetch and parse RSS feed.
@@ -20,7 +73,7 @@ class RSSFetcher(BaseFetcher):
         Returns:
             List of parsed feed items
         """
-        feed_url = self.source_config.get('url')
+        feed_url = self.source_url
         if not feed_url:
             logger.error(f"No URL provided for source: {self.source_name}")
             return []
@@ -28,15 +81,32 @@ class RSSFetcher(BaseFetcher):
         logger.info(f"Fetching RSS feed: {self.source_name} ({feed_url})")
 
         try:
-            # Parse feed
-            feed = feedparser.parse(feed_url)
+            cached = self.cache.get(feed_url) or {}
+
+            # Download over the pooled session, then parse the raw bytes
+            response = self.http_client.fetch(feed_url, headers=self._conditional_headers(cached))
+
+            if response.status_code == 304 and 'items' in cached:
+                logger.info(f"Feed not modified: {self.source_name} ({len(cached['items'])} cached items)")
+                return cached['items']
+
+            feed = feedparser.parse(response.content)
+
+            # One fetch timestamp for the whole feed rather than per entry
+            fetched_date = datetime.now().isoformat()
 
             items = []
             for entry in feed.entries:
-                item = self._parse_entry(entry)
+                item = self._parse_entry(entry, fetched_date)
                 if item:
                     items.append(item)
 
+            self.cache.set(feed_url, {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'items': items
+            })
+
             logger.info(f"Fetched {len(items)} items from {self.source_name}")
             return items
 
@@ -44,15 +114,15 @@ class RSSFetcher(BaseFetcher):
             logger.error(f"Failed to fetch RSS feed {self.source_name}: {e}")
             return []
 
-    def _parse_entry(self, entry: Any) -> Dict[str, Any]:
+    def _parse_entry(self, entry: Any, fetched_date: Optional[str] = None) -> Dict[str, Any]:
         """Parse a single feed entry."""
         try:
             # Extract published date
             pub_date = None
             if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                pub_date = datetime(*entry.published_parsed[:6]).isoformat()
+                pub_date = _iso_from_struct(tuple(entry.published_parsed[:6]))
             elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                pub_date = datetime(*entry.updated_parsed[:6]).isoformat()
+                pub_date = _iso_from_struct(tuple(entry.updated_parsed[:6]))
 
             return {
                 'title': entry.get('title', 'Untitled'),
@@ -60,9 +130,9 @@ class RSSFetcher(BaseFetcher):
                 'content': entry.get('summary', ''),
                 'pub_date': pub_date,
                 'source': self.source_name,
-                'source_url': self.source_config.get('url'),
-                'authors': [author.get('name', 'Unknown') for author in entry.get('authors', [])],
-                'fetched_date': datetime.now().isoformat()
+                'source_url': self.source_url,
+                'authors': [author.get('name', 'Unknown') for author in (entry.get('authors') or ())],
+                'fetched_date': fetched_date or datetime.now().isoformat()
             }
         except Exception as e:
             logger.warning(f"Failed to parse entry: {e}")
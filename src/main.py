@@ -1,8 +1,10 @@
 """Main pipeline orchestrator."""
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Any
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
 from .config import Config
@@ -20,11 +22,144 @@ from .scoring.score_weights import ScoreWeights
 from .summarization.summarizer_factory import SummarizerFactory
 from .outputs.json_generator import JSONGenerator
 from .outputs.html_generator import HTMLGenerator
+from .utils.keyword_matcher import KeywordIndex
 from .utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+# Source type -> fetcher class
+FETCHERS = {
+    'rss': RSSFetcher,
+}
+
+
+def fetch_sources(sources_by_type: Dict[Optional[str], List[Dict[str, Any]]],
+                  max_workers: int = 8,
+                  on_fetched: Optional[Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]] = None
+                  ) -> List[Dict[str, Any]]:
+    """
+    Fetch sources concurrently using the fetcher registered for each type.
+
+    Each source's items are handed to ``on_fetched`` as soon as that source
+    completes, so per-item processing overlaps with fetches still in flight.
+    The callback runs on the calling thread.
+
+    Args:
+        sources_by_type: Source configuration dicts grouped by type
+        max_workers: Maximum number of concurrent fetches
+        on_fetched: Optional transform applied to each source's items
+
+    Returns:
+        All fetched (and transformed) items, in source order
+    """
+    jobs = []
+    for source_type, sources in sources_by_type.items():
+        fetcher_cls = FETCHERS.get(source_type)
+        if fetcher_cls is None:
+            logger.warning(f"No fetcher for source type '{source_type}', skipping {len(sources)} sources")
+            continue
+        jobs.extend((fetcher_cls, source) for source in sources)
+
+    if not jobs:
+        return []
+
+    # Feed fetches are network-bound, so threads overlap the waits
+    workers = max(1, min(max_workers, len(jobs)))
+    results: List[List[Dict[str, Any]]] = [[] for _ in jobs]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(lambda job: job[0](job[1]).fetch(), job): index
+            for index, job in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            items = future.result()
+            results[futures[future]] = on_fetched(items) if on_fetched else items
+
+    # Reassemble in source order so deduplication keeps the same first occurrence
+    return [item for items in results for item in items]
+
+
+# Below this many items, starting worker processes costs more than scoring saves
+PARALLEL_SCORING_THRESHOLD = 2000
+
+# Items per batch sent to a scoring worker
+SCORING_BATCH_SIZE = 256
+
+# Scorers built once per worker process by _init_worker_scorers
+_worker_scorers = None
+
+
+def _build_scorers(config: Config) -> Tuple[Dict[str, Any], ScoreWeights]:
+    """Create the scorer for each dimension plus the weight combiner."""
+    scorers = {
+        'relevance': RelevanceScorer(config),
+        'credibility': CredibilityScorer(),
+        'impact': ImpactScorer(),
+        'freshness': FreshnessScorer(),
+        'practicality': PracticalityScorer()
+    }
+    return scorers, ScoreWeights(config)
+
+
+def _score_batch(scorers: Tuple[Dict[str, Any], ScoreWeights],
+                 items: List[Dict[str, Any]]) -> List[Tuple[Dict[str, float], float]]:
+    """Score a batch one dimension at a time, then combine into final scores."""
+    dimension_scorers, score_weights = scorers
+    dimensions = list(dimension_scorers)
+    rows = list(zip(*(map(scorer.score, items) for scorer in dimension_scorers.values())))
+    final_scores = score_weights.calculate_weighted_scores(dimensions, rows)
+    return [(dict(zip(dimensions, row)), final_score) for row, final_score in zip(rows, final_scores)]
+
+
+def _init_worker_scorers(config_snapshot: Dict[str, Any]) -> None:
+    """Process pool initializer: build scorers once per worker from a config snapshot."""
+    global _worker_scorers
+    _worker_scorers = _build_scorers(Config.from_snapshot(config_snapshot))
+
+
+def _score_batch_in_worker(items: List[Dict[str, Any]]) -> List[Tuple[Dict[str, float], float]]:
+    """Score a batch using the worker's scorers."""
+    return _score_batch(_worker_scorers, items)
+
+
+def score_items(items: List[Dict[str, Any]],
+                config: Config,
+                max_workers: Optional[int] = None,
+                scorers: Optional[Tuple[Dict[str, Any], ScoreWeights]] = None) -> List[Dict[str, Any]]:
+    """
+    Add 'scores' and 'final_score' to each item.
+
+    Large corpora are scored across a process pool; workers rebuild the
+    scorers from a plain config snapshot, only the scores are sent back,
+    and items are updated in place.
+
+    Args:
+        items: Items to score
+        config: Configuration object
+        max_workers: Worker processes for large corpora (defaults to CPU count)
+        scorers: Prebuilt scorers for in-process scoring (optional)
+
+    Returns:
+        The same items, scored
+    """
+    if len(items) < PARALLEL_SCORING_THRESHOLD:
+        scorers = scorers or _build_scorers(config)
+        results = _score_batch(scorers, items)
+    else:
+        batches = [items[n:n + SCORING_BATCH_SIZE] for n in range(0, len(items), SCORING_BATCH_SIZE)]
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_worker_scorers,
+                                 initargs=(config.snapshot(),)) as pool:
+            results = [result for batch in pool.map(_score_batch_in_worker, batches) for result in batch]
+
+    for item, (scores, final_score) in zip(items, results):
+        item['scores'] = scores
+        item['final_score'] = final_score
+
+    return items
+
+
 def main(mode: str = 'daily') -> Dict[str, Any]:
     """
     Run intelligence pipeline.
@@ -42,63 +177,52 @@ def main(mode: str = 'daily') -> Dict[str, Any]:
     config = Config()
     logger.info(f"Loaded {len(config.sources)} sources")
 
-    # 2. Fetch content
-    all_items = []
-    for source in config.sources:
-        if source.get('type') == 'rss':
-            fetcher = RSSFetcher(source)
-            items = fetcher.fetch()
-            all_items.extend(items)
-
-    logger.info(f"Fetched {len(all_items)} total items")
-
-    # 3. Process: Parse, Normalize, Deduplicate, Cluster
-    logger.info("Processing items...")
+    # 2-3. Fetch content, parsing and normalizing each source as it arrives
     parser = Parser()
     normalizer = Normalizer()
     deduplicator = Deduplicator()
     clustering = Clustering()
+    fetched_count = 0
+
+    def process_fetched(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        nonlocal fetched_count
+        fetched_count += len(items)
 
-    # Parse HTML content
-    for item in all_items:
-        content = item.get('content', '')
-        item['content'] = parser.parse(content)
+        # Parse HTML content
+        for item in items:
+            content = item.get('content', '')
+            item['content'] = parser.parse(content)
 
-    # Normalize
-    normalized_items = normalizer.normalize_batch(all_items)
+        return normalizer.normalize_batch(items)
+
+    normalized_items = fetch_sources(config.sources_by_type, config.fetch_max_workers, process_fetched)
+    logger.info(f"Fetched {fetched_count} total items")
     logger.info(f"Normalized {len(normalized_items)} items")
 
+    # 3. Process: Deduplicate, Cluster
+    logger.info("Processing items...")
+
     # Deduplicate
     dedup_result = deduplicator.deduplicate(normalized_items)
     unique_items = dedup_result['unique_items']
     logger.info(f"Deduplicated: {len(unique_items)} unique items")
 
+    # Scan each item's text once for clustering and all keyword-based scorers
+    scorers = _build_scorers(config)
+    keyword_index = KeywordIndex.from_components([clustering, *scorers[0].values()])
+    for item in unique_items:
+        keyword_index.annotate(item)
+
     # Cluster
     clustered_items = clustering.cluster(unique_items)
     logger.info(f"Clustered {len(clustered_items)} items")
 
     # 4. Score: Calculate multi-dimensional scores
     logger.info("Scoring items...")
-    relevance_scorer = RelevanceScorer(config)
-    credibility_scorer = CredibilityScorer()
-    impact_scorer = ImpactScorer()
-    freshness_scorer = FreshnessScorer()
-    practicality_scorer = PracticalityScorer()
-    score_weights = ScoreWeights(config)
-
-    for item in clustered_items:
-        scores = {
-            'relevance': relevance_scorer.score(item),
-            'credibility': credibility_scorer.score(item),
-            'impact': impact_scorer.score(item),
-            'freshness': freshness_scorer.score(item),
-            'practicality': practicality_scorer.score(item)
-        }
-        item['scores'] = scores
-        item['final_score'] = score_weights.calculate_weighted_score(scores)
+    score_items(clustered_items, config, scorers=scorers)
 
     # Sort by final score
-    ranked_items = sorted(clustered_items, key=lambda x: x['final_score'], reverse=True)
+    ranked_items = sorted(clustered_items, key=itemgetter('final_score'), reverse=True)
     logger.info(f"Scored and ranked {len(ranked_items)} items")
 
     # 5. Summarize: Top 20 items
@@ -128,7 +252,7 @@ def main(mode: str = 'daily') -> Dict[str, Any]:
     # Private archive
     json_gen.generate_private_archive(
         ranked_items,  # All items with scores
-        f'private/feeds/{today}.json'
+        f'private/feeds/{today}.json.gz'
     )
 
     elapsed = (datetime.now() - start_time).total_seconds()
@@ -136,7 +260,7 @@ def main(mode: str = 'daily') -> Dict[str, Any]:
 
     return {
         'mode': mode,
-        'items_fetched': len(all_items),
+        'items_fetched': fetched_count,
         'items_processed': len(normalized_items),
         'items_unique': len(unique_items),
         'items_scored': len(ranked_items),
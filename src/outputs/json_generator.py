@@ -1,14 +1,20 @@
 """
 JSON generator for public and private datasets.
 """
-import json
-from pathlib import Path
 from typing import List, Dict, Any
 from datetime import datetime
+from collections import Counter
+import contextlib
+import gzip
+import orjson
 from src.utils.logger import get_logger
+from src.utils.file_utils import atomic_open, atomic_write_bytes
 
 logger = get_logger(__name__)
 
+# Large write buffer so streamed archives hit the disk in few syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 class JSONGenerator:
     """Generate JSON datasets for public and private use."""
@@ -17,6 +23,66 @@ class JSONGenerator:
         """Initialize JSON generator."""
         pass
 
+    def _write_json(self, output: Dict[str, Any], output_path: str, indent: bool = True) -> None:
+        """
+        Serialize output with orjson and atomically write it to disk.
+
+        Args:
+            output: JSON-serializable data
+            output_path: Path to save JSON file
+            indent: Pretty-print with 2-space indentation
+        """
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+
+        atomic_write_bytes(output_path, orjson.dumps(output, option=option))
+
+    def _write_json_stream(self,
+                           header: Dict[str, Any],
+                           items: List[Dict[str, Any]],
+                           output_path: str) -> None:
+        """
+        Write {**header, "items": [...]} as compact JSON, encoding one item at a time.
+
+        Avoids building the whole document in memory, which matters for
+        archives holding every ranked item with full metadata.
+
+        Args:
+            header: Top-level fields written before the items array
+            items: Items to write
+            output_path: Path to save JSON file
+        """
+        with contextlib.ExitStack() as stack:
+            f = stack.enter_context(atomic_open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE))
+            if str(output_path).endswith('.gz'):
+                # Level 3 compresses JSON well at a small fraction of level 9's CPU cost
+                f = stack.enter_context(gzip.GzipFile(fileobj=f, mode='wb', compresslevel=3))
+
+            f.write(orjson.dumps(header, option=orjson.OPT_NON_STR_KEYS)[:-1])
+            f.write(b',"items":[' if header else b'"items":[')
+            for i, item in enumerate(items):
+                if i:
+                    f.write(b',')
+                # Underscore-prefixed fields are pipeline-internal working state
+                record = {k: v for k, v in item.items() if not k.startswith('_')}
+                f.write(orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS))
+            f.write(b']}')
+
+    def load_private_archive(self, archive_path: str) -> Dict[str, Any]:
+        """
+        Load a private archive written by generate_private_archive.
+
+        Args:
+            archive_path: Path to a .json or gzip-compressed .json.gz archive
+
+        Returns:
+            Archive dictionary with generated_at, item_count and items
+        """
+        opener = gzip.open if str(archive_path).endswith('.gz') else open
+        with opener(archive_path, 'rb') as f:
+            return orjson.loads(f.read())
+
     def generate_public_brief(self,
                               items: List[Dict[str, Any]],
                               output_path: str,
@@ -56,11 +122,7 @@ class JSONGenerator:
         }
 
         # Write to file
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_file, 'w') as f:
-            json.dump(output, f, indent=2)
+        self._write_json(output, output_path)
 
         logger.info(f"Generated public brief: {output_path} ({len(public_items)} items)")
 
@@ -70,23 +132,21 @@ class JSONGenerator:
         """
         Generate private archive with full data and scores.
 
+        The archive is compact (unindented) JSON, gzip-compressed when
+        output_path ends in .gz.
+
         Args:
             items: List of items with all fields and scores
             output_path: Path to save JSON file
         """
         # Create output structure with full data
-        output = {
+        header = {
             'generated_at': datetime.now().isoformat(),
-            'item_count': len(items),
-            'items': items
+            'item_count': len(items)
         }
 
-        # Write to file
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_file, 'w') as f:
-            json.dump(output, f, indent=2)
+        # Stream items to file
+        self._write_json_stream(header, items, output_path)
 
         logger.info(f"Generated private archive: {output_path} ({len(items)} items)")
 
@@ -102,21 +162,13 @@ class JSONGenerator:
             output_path: Path to save JSON file
             days: Number of days covered
         """
-        # Aggregate by cluster
-        cluster_counts = {}
-        for item in items:
-            cluster = item.get('cluster_id', 'general')
-            cluster_counts[cluster] = cluster_counts.get(cluster, 0) + 1
-
-        # Aggregate by source
-        source_counts = {}
-        for item in items:
-            source = item.get('source', 'Unknown')
-            source_counts[source] = source_counts.get(source, 0) + 1
+        # Aggregate by cluster and source; Counter tallies an iterable in C
+        cluster_counts = Counter([item.get('cluster_id', 'general') for item in items])
+        source_counts = Counter([item.get('source', 'Unknown') for item in items])
 
         # Top clusters and sources
-        top_clusters = sorted(cluster_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        top_sources = sorted(source_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_clusters = cluster_counts.most_common(10)
+        top_sources = source_counts.most_common(10)
 
         # Generate opportunities (simple version - top clusters)
         opportunities = [
@@ -138,10 +190,6 @@ class JSONGenerator:
         }
 
         # Write to file
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_file, 'w') as f:
-            json.dump(output, f, indent=2)
+        self._write_json(output, output_path)
 
         logger.info(f"Generated trends: {output_path}")
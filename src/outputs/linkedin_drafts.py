@@ -2,10 +2,10 @@
 LinkedIn post draft generator.
 """
 import json
-from pathlib import Path
 from typing import List, Dict, Any
 from datetime import datetime
 from src.utils.logger import get_logger
+from src.utils.file_utils import atomic_open
 
 logger = get_logger(__name__)
 
@@ -93,10 +93,8 @@ How is your team adapting?
             'drafts': drafts
         }
 
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_file, 'w') as f:
-            json.dump(output, f, indent=2)
+        # Keep emoji and non-ASCII titles as UTF-8 rather than \uXXXX escapes
+        with atomic_open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
 
         logger.info(f"Generated {len(drafts)} LinkedIn drafts: {output_path}")
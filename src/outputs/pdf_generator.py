@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import List, Dict, Any
 from datetime import datetime
 from src.utils.logger import get_logger
+from src.utils.file_utils import atomic_write_text
 
 logger = get_logger(__name__)
 
@@ -30,7 +31,6 @@ class PDFGenerator:
         # For now, just create a text file as placeholder
 
         output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Generate simple text version
         content = f"""AI Security Weekly Brief
@@ -49,7 +49,6 @@ Total Items: {len(items)}
 
         # Save as .txt for now (will be .pdf when ReportLab is fully integrated)
         text_path = output_file.with_suffix('.txt')
-        with open(text_path, 'w') as f:
-            f.write(content)
+        atomic_write_text(text_path, content)
 
         logger.info(f"Generated weekly brief (placeholder): {text_path}")
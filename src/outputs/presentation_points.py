@@ -2,11 +2,11 @@
 Presentation talking points generator.
 """
 import json
-from pathlib import Path
 from typing import List, Dict, Any
 from datetime import datetime
-from collections import Counter
+from collections import Counter, defaultdict
 from src.utils.logger import get_logger
+from src.utils.file_utils import atomic_open
 
 logger = get_logger(__name__)
 
@@ -30,11 +30,13 @@ class PresentationPoints:
             output_path: Path to save points JSON
             num_points: Number of talking points to generate
         """
-        # Analyze clusters to find top themes
+        # Analyze clusters to find top themes, indexing items by cluster in the same pass
         cluster_counts = Counter()
+        items_by_cluster = defaultdict(list)
         for item in items:
             cluster = item.get('cluster_id', 'general')
             cluster_counts[cluster] += 1
+            items_by_cluster[cluster].append(item)
 
         top_clusters = cluster_counts.most_common(5)
 
@@ -43,7 +45,7 @@ class PresentationPoints:
         # Generate talking points based on top clusters
         for cluster, count in top_clusters:
             # Get example items from this cluster
-            cluster_items = [item for item in items if item.get('cluster_id') == cluster][:2]
+            cluster_items = items_by_cluster[cluster][:2]
 
             if cluster_items:
                 point = {
@@ -82,10 +84,8 @@ class PresentationPoints:
             'talking_points': points[:num_points]
         }
 
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_file, 'w') as f:
-            json.dump(output, f, indent=2)
+        # Keep emoji and non-ASCII titles as UTF-8 rather than \uXXXX escapes
+        with atomic_open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
 
         logger.info(f"Generated {len(points)} presentation points: {output_path}")
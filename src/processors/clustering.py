@@ -2,7 +2,8 @@
 Clustering for grouping similar articles by topic.
 """
 from typing import List, Dict, Any
-from collections import defaultdict
+from collections import Counter
+from src.utils.keyword_matcher import KeywordMatcher
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -11,6 +12,9 @@ logger = get_logger(__name__)
 class Clustering:
     """Group similar articles by topic using keyword-based clustering."""
 
+    # Stage name for counts precomputed by KeywordIndex
+    KEYWORD_STAGE = 'cluster'
+
     def __init__(self, keywords: Dict[str, List[str]] = None):
         """
         Initialize the clustering engine.
@@ -19,6 +23,7 @@ class Clustering:
             keywords: Dictionary mapping cluster names to keyword lists
         """
         self.keywords = keywords or self._default_keywords()
+        self.matcher = KeywordMatcher(self.keywords)
 
     def _default_keywords(self) -> Dict[str, List[str]]:
         """
@@ -49,17 +54,8 @@ class Clustering:
         Returns:
             Cluster name (or 'general' if no match)
         """
-        title = item.get('title', '').lower()
-        content = item.get('content', '').lower()
-        text = f"{title} {content}"
-
-        # Count keyword matches for each cluster
-        cluster_scores = defaultdict(int)
-
-        for cluster_name, keyword_list in self.keywords.items():
-            for keyword in keyword_list:
-                if keyword.lower() in text:
-                    cluster_scores[cluster_name] += 1
+        # Count keyword matches for each cluster in a single scan
+        cluster_scores = self.matcher.count_item(item, self.KEYWORD_STAGE)
 
         # Return cluster with highest score, or 'general' if no matches
         if cluster_scores:
@@ -91,11 +87,9 @@ class Clustering:
                 clustered_items.append(item)
 
         # Log cluster distribution
-        cluster_counts = defaultdict(int)
-        for item in clustered_items:
-            cluster_counts[item['cluster_id']] += 1
+        cluster_counts = Counter([item['cluster_id'] for item in clustered_items])
 
         logger.info(f"Clustered {len(clustered_items)} items into {len(cluster_counts)} clusters")
-        logger.debug(f"Cluster distribution: {dict(cluster_counts)}")
+        logger.debug("Cluster distribution: %s", dict(cluster_counts))
 
         return clustered_items
@@ -1,16 +1,143 @@
 """
 Deduplicator for detecting duplicate articles.
 """
-from typing import List, Dict, Any
-from difflib import SequenceMatcher
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+from rapidfuzz.fuzz import ratio
+from src.processors.minhash_lsh import MinHashLSH
+from src.processors.normalizer import CONTENT_LOWER_FIELD
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# (deduplicator, items) set once per worker process by _init_verify_worker
+_worker_state = None
+
+
+def _init_verify_worker(deduplicator: 'Deduplicator', items: List[Dict[str, Any]]) -> None:
+    """Process pool initializer: receive the items once per worker."""
+    global _worker_state
+    _worker_state = (deduplicator, items)
+
+
+def _verify_pairs_in_worker(pairs: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Return the pairs in a chunk that are duplicates."""
+    deduplicator, items = _worker_state
+    return deduplicator._verify_pairs(items, pairs)
+
+
+class _UnionFind:
+    """Disjoint sets over item indices; each set's root is its lowest index."""
+
+    def __init__(self, count: int = 0):
+        self.parent = list(range(count))
+
+    def add(self) -> int:
+        """Add a singleton set and return its index."""
+        self.parent.append(len(self.parent))
+        return len(self.parent) - 1
+
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # Path halving
+            i = parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> None:
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i != root_j:
+            # The lower index stays the root, so each root is its group's first item
+            if root_i < root_j:
+                self.parent[root_j] = root_i
+            else:
+                self.parent[root_i] = root_j
+
+    def groups(self) -> List[List[int]]:
+        """Index groups in ascending order of their first index, each ascending."""
+        groups: Dict[int, List[int]] = {}
+        for i in range(len(self.parent)):
+            groups.setdefault(self.find(i), []).append(i)
+        return list(groups.values())
+
+
+class _CandidateIndex:
+    """
+    Incremental index proposing which earlier items a new item may duplicate.
+
+    Items are linked to the previous item with the same (case-insensitive)
+    title. Content is compared against every earlier item until
+    ``lsh_min_items`` have been added, then only against MinHash-LSH
+    candidates. Only title keys, signatures and LSH buckets are kept.
+    """
+
+    def __init__(self, lsh_min_items: int, min_content_length: int):
+        self.lsh_min_items = lsh_min_items
+        self.min_content_length = min_content_length
+        self.title_keys: List[str] = []
+        self._last_by_title: Dict[str, int] = {}
+        self._lsh = MinHashLSH()
+        self._signatures: Dict[str, Optional[Tuple[int, ...]]] = {}
+
+    def add(self, item: Dict[str, Any]) -> Tuple[Optional[int], List[int]]:
+        """
+        Index the next item.
+
+        Returns:
+            (earlier item with the same title or None,
+             ascending earlier indices to check for similar content)
+        """
+        index = len(self.title_keys)
+        title = item.get('title', '').strip().lower()
+        self.title_keys.append(title)
+
+        previous = None
+        if title:
+            previous = self._last_by_title.get(title)
+            self._last_by_title[title] = index
+
+        candidates = self._content_candidates(index, item.get('content', ''))
+        if title:
+            # Same-title pairs are already linked through ``previous``
+            candidates = [j for j in candidates if self.title_keys[j] != title]
+        return previous, candidates
+
+    def _content_candidates(self, index: int, content: str) -> List[int]:
+        if not content or len(content) < self.min_content_length:
+            return []
+
+        # Identical content (the common syndication case) is signed once
+        if content in self._signatures:
+            signature = self._signatures[content]
+        else:
+            signature = self._signatures[content] = self._lsh.signature(content)
+
+        if signature is None:
+            return list(range(index)) if index < self.lsh_min_items else []
+
+        # Index the signature even while comparing exhaustively, so LSH
+        # lookups after lsh_min_items cover every earlier item
+        lsh_candidates = self._lsh.query_and_insert(index, signature)
+        if index < self.lsh_min_items:
+            return list(range(index))
+        return sorted(lsh_candidates)
+
 
 class Deduplicator:
     """Detect and remove duplicate articles."""
 
+    # Minimum content length for the content-similarity check (avoids false positives)
+    MIN_CONTENT_LENGTH = 50
+
+    # Below this many items every pair is compared; above it, MinHash-LSH
+    # narrows content comparisons to likely near-duplicates
+    LSH_MIN_ITEMS = 64
+
+    # Below this many candidate pairs, starting worker processes costs more
+    # than verifying in-process
+    PARALLEL_VERIFY_THRESHOLD = 20000
+    VERIFY_CHUNK_SIZE = 2048
+
     def __init__(self, similarity_threshold: float = 0.8):
         """
         Initialize the deduplicator.
@@ -19,11 +146,58 @@ class Deduplicator:
             similarity_threshold: Minimum similarity ratio (0-1) to consider items duplicates
         """
         self.similarity_threshold = similarity_threshold
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget items seen through add()."""
+        self._seen: List[Dict[str, Any]] = []
+        self._seen_index = _CandidateIndex(self.LSH_MIN_ITEMS, self.MIN_CONTENT_LENGTH)
+        self._seen_groups = _UnionFind()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Verification workers need the settings, not the add() stream
+        return {k: v for k, v in self.__dict__.items() if not k.startswith('_seen')}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.reset()
+
+    def add(self, item: Dict[str, Any]) -> int:
+        """
+        Add one item to the running deduplication and check it against earlier items.
+
+        Items are compared as they arrive, using the same rules as
+        deduplicate(), so a stream can be deduplicated without collecting
+        it first. Call reset() to start a new stream.
+
+        Args:
+            item: Next item
+
+        Returns:
+            Index (in add() order) of the first item in this item's duplicate
+            group so far; equal to the item's own index if it is new. A later
+            item that duplicates two groups merges them.
+        """
+        previous, candidates = self._seen_index.add(item)
+        index = self._seen_groups.add()
+        self._seen.append(item)
+
+        if previous is not None:
+            self._seen_groups.union(previous, index)
+        for j in candidates:
+            # Skip items already in this group (transitively)
+            if self._seen_groups.find(j) != self._seen_groups.find(index) and self.are_duplicates(self._seen[j], item):
+                self._seen_groups.union(j, index)
+
+        return self._seen_groups.find(index)
 
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """
         Calculate similarity between two text strings.
 
+        Uses rapidfuzz's normalized Indel similarity, the metric difflib's
+        SequenceMatcher.ratio approximates, computed exactly in C++.
+
         Args:
             text1: First text string
             text2: Second text string
@@ -34,7 +208,7 @@ class Deduplicator:
         if not text1 or not text2:
             return 0.0
 
-        return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+        return ratio(text1.lower(), text2.lower()) / 100.0
 
     def are_duplicates(self, item1: Dict[str, Any], item2: Dict[str, Any]) -> bool:
         """
@@ -59,14 +233,96 @@ class Deduplicator:
         content2 = item2.get('content', '')
 
         # Require minimum content length to check similarity
-        MIN_CONTENT_LENGTH = 50
-        if content1 and content2 and len(content1) >= MIN_CONTENT_LENGTH and len(content2) >= MIN_CONTENT_LENGTH:
-            similarity = self.calculate_similarity(content1, content2)
+        min_length = self.MIN_CONTENT_LENGTH
+        if content1 and content2 and len(content1) >= min_length and len(content2) >= min_length:
+            # Compare the lowercased copies made by Normalizer when available
+            lower1 = item1.get(CONTENT_LOWER_FIELD) or content1.lower()
+            lower2 = item2.get(CONTENT_LOWER_FIELD) or content2.lower()
+
+            # Syndicated copies are often identical; a C-level compare settles those
+            if lower1 == lower2:
+                return True
+
+            # With a cutoff, rapidfuzz rejects pairs whose length difference
+            # alone rules out the threshold and stops early on the rest
+            # (scores below the cutoff come back as 0). The epsilon absorbs
+            # float error in threshold * 100 so pairs exactly at the threshold match.
+            score_cutoff = max(self.similarity_threshold * 100 - 1e-6, 0)
+            similarity = ratio(lower1, lower2, score_cutoff=score_cutoff) / 100.0
             if similarity >= self.similarity_threshold:
                 return True
 
         return False
 
+    def _verify_pairs(self, items: List[Dict[str, Any]],
+                      pairs: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Return the candidate pairs that are duplicates."""
+        return [(i, j) for i, j in pairs if self.are_duplicates(items[i], items[j])]
+
+    def find_duplicate_pairs(self, items: List[Dict[str, Any]],
+                             max_workers: Optional[int] = None) -> List[Tuple[int, int]]:
+        """
+        Find duplicate pairs linking the items of every duplicate group.
+
+        Items with the same (case-insensitive) title are chained together
+        without further checks. Only pairs with different titles go through
+        the content-similarity check: all pairs for the first LSH_MIN_ITEMS
+        items, MinHash-LSH candidates after that. Large candidate sets are
+        verified across a process pool, each worker receiving the titles and
+        contents once and then checking chunks of pairs.
+
+        Args:
+            items: Items to compare
+            max_workers: Worker processes for large candidate sets (defaults to CPU count)
+
+        Returns:
+            Sorted (i, j) index pairs with i < j
+        """
+        index = _CandidateIndex(self.LSH_MIN_ITEMS, self.MIN_CONTENT_LENGTH)
+        title_pairs = []
+        pairs = []
+        for j, item in enumerate(items):
+            previous, candidates = index.add(item)
+            if previous is not None:
+                title_pairs.append((previous, j))
+            pairs.extend((i, j) for i in candidates)
+
+        if len(pairs) < self.PARALLEL_VERIFY_THRESHOLD:
+            verified = self._verify_pairs(items, pairs)
+        else:
+            texts = [
+                {'title': item.get('title', ''), 'content': item.get('content', ''),
+                 CONTENT_LOWER_FIELD: item.get(CONTENT_LOWER_FIELD)}
+                for item in items
+            ]
+            chunks = [pairs[n:n + self.VERIFY_CHUNK_SIZE] for n in range(0, len(pairs), self.VERIFY_CHUNK_SIZE)]
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=_init_verify_worker,
+                                     initargs=(self, texts)) as pool:
+                verified = [pair for chunk in pool.map(_verify_pairs_in_worker, chunks) for pair in chunk]
+
+        return sorted(title_pairs + verified)
+
+    def _group_duplicates(self, count: int, pairs: List[Tuple[int, int]]) -> List[List[int]]:
+        """
+        Merge duplicate pairs into groups with union-find.
+
+        Duplicates are grouped transitively: if A duplicates B and B
+        duplicates C, all three form one group.
+
+        Args:
+            count: Number of items
+            pairs: Duplicate (i, j) index pairs
+
+        Returns:
+            Index groups in ascending order of their first (lowest) index,
+            each group ascending
+        """
+        union_find = _UnionFind(count)
+        for i, j in pairs:
+            union_find.union(i, j)
+        return union_find.groups()
+
     def deduplicate(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Remove duplicates from a list of items.
@@ -79,6 +335,8 @@ class Deduplicator:
             - unique_count: Number of unique items
             - unique_items: List of unique items (first occurrence of each duplicate group)
             - duplicate_groups: List of lists, each containing duplicate items
+
+        Duplicate groups are transitive (see _group_duplicates).
         """
         if not items:
             return {
@@ -89,30 +347,14 @@ class Deduplicator:
 
         unique_items = []
         duplicate_groups = []
-        processed_indices = set()
-
-        for i, item in enumerate(items):
-            if i in processed_indices:
-                continue
-
-            # Find all duplicates of this item
-            duplicates = [item]
-            processed_indices.add(i)
-
-            for j in range(i + 1, len(items)):
-                if j in processed_indices:
-                    continue
-
-                if self.are_duplicates(item, items[j]):
-                    duplicates.append(items[j])
-                    processed_indices.add(j)
 
+        for group in self._group_duplicates(len(items), self.find_duplicate_pairs(items)):
             # Add to unique items (first occurrence)
-            unique_items.append(item)
+            unique_items.append(items[group[0]])
 
             # If there were duplicates, add to duplicate groups
-            if len(duplicates) > 1:
-                duplicate_groups.append(duplicates)
+            if len(group) > 1:
+                duplicate_groups.append([items[i] for i in group])
 
         logger.info(f"Deduplication: {len(items)} items → {len(unique_items)} unique ({len(items) - len(unique_items)} duplicates removed)")
 
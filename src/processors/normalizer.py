@@ -1,13 +1,17 @@
 """
 Normalizer for standardizing data schema across different sources.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
-from dateutil import parser as date_parser
+from src.utils.date_utils import PUBLISHED_DT_FIELD, parse_datetime
+from src.utils.keyword_matcher import TEXT_LOWER_FIELD, lowered_text
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Item field holding lowercased content, for the deduplicator's similarity check
+CONTENT_LOWER_FIELD = '_content_lower'
+
 
 class Normalizer:
     """Standardize data schema across all sources."""
@@ -28,20 +32,22 @@ class Normalizer:
         Returns:
             ISO format date string or default value
         """
+        return self._parse_date(date_value)[0]
+
+    def _parse_date(self, date_value: Any) -> Tuple[str, Optional[datetime]]:
+        """Normalize a date, also returning the parsed datetime (None if unavailable)."""
         if not date_value:
-            return "No date available"
+            return "No date available", None
 
         try:
-            if isinstance(date_value, datetime):
-                return date_value.isoformat()
-            elif isinstance(date_value, str):
-                parsed_date = date_parser.parse(date_value)
-                return parsed_date.isoformat()
+            if isinstance(date_value, (datetime, str)):
+                parsed_date = parse_datetime(date_value)
+                return parsed_date.isoformat(), parsed_date
             else:
-                return str(date_value)
+                return str(date_value), None
         except Exception as e:
             logger.warning(f"Error parsing date '{date_value}': {e}")
-            return "No date available"
+            return "No date available", None
 
     def normalize_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -59,15 +65,18 @@ class Normalizer:
         normalized['title'] = item.get('title', 'Untitled')
         normalized['content'] = item.get('content') or item.get('summary') or item.get('description') or ""
         normalized['url'] = item.get('url') or item.get('link') or ""
-        normalized['published_date'] = self.normalize_date(item.get('published_date') or item.get('published') or item.get('pubDate'))
+        # Keep the parsed datetime so FreshnessScorer doesn't parse the date again
+        normalized['published_date'], normalized[PUBLISHED_DT_FIELD] = self._parse_date(
+            item.get('published_date') or item.get('published') or item.get('pubDate'))
         normalized['source'] = item.get('source', 'Unknown')
 
-        # Preserve any extra fields
-        for key, value in item.items():
-            if key not in normalized:
-                normalized[key] = value
+        # Lowercase once here so dedup, clustering and scoring don't each copy the text
+        normalized[TEXT_LOWER_FIELD] = lowered_text(normalized['title'], normalized['content'])
+        normalized[CONTENT_LOWER_FIELD] = normalized['content'].lower()
 
-        return normalized
+        # Preserve any extra fields: merged in C, the normalized values win and
+        # keep their leading position, followed by the item's other keys
+        return {**normalized, **item, **normalized}
 
     def normalize(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -1,12 +1,17 @@
 """
 HTML/XML parser for extracting clean text from web content.
 """
+import re
 from typing import Optional
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# lxml rejects str input that carries an encoding declaration
+_XML_DECLARATION_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+
 
 class Parser:
     """Parse HTML/XML content and extract clean text."""
@@ -28,20 +33,23 @@ class Parser:
         if not html_content:
             return ""
 
-        try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
+        # Plain text (no tags or entities) only needs whitespace collapsed
+        if '<' not in html_content and '&' not in html_content:
+            return ' '.join(html_content.split())
 
-            # Get text and clean up whitespace
-            text = soup.get_text(separator=' ', strip=True)
+        try:
+            root = lxml_html.fromstring(_XML_DECLARATION_RE.sub('', html_content))
 
-            # Collapse multiple spaces
-            text = ' '.join(text.split())
+            # Empty script and style elements, keeping the text that follows them
+            for element in root.iter('script', 'style'):
+                element.text = None
+                element[:] = []
 
-            return text
+            # Join text nodes with spaces and collapse whitespace
+            return ' '.join(' '.join(root.itertext()).split())
+        except etree.ParserError:
+            # Whitespace or comments only
+            return ""
         except Exception as e:
             logger.error(f"Error parsing HTML: {e}")
             return html_content  # Return original if parsing fails
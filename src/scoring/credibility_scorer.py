@@ -37,6 +37,6 @@ class CredibilityScorer:
 
         score = self.TIER_SCORES.get(tier, 50)
 
-        logger.debug(f"Credibility score for '{item.get('source', 'Unknown')}': {score} (tier: {tier})")
+        logger.debug("Credibility score for '%s': %s (tier: %s)", item.get('source', 'Unknown'), score, tier)
 
         return float(score)
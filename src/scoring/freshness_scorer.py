@@ -1,9 +1,10 @@
 """
 Freshness scorer for recency assessment.
 """
+from bisect import bisect_right
 from typing import Dict, Any
-from datetime import datetime, timedelta
-from dateutil import parser as date_parser
+from datetime import datetime
+from src.utils.date_utils import PUBLISHED_DT_FIELD, parse_datetime
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -12,6 +13,11 @@ logger = get_logger(__name__)
 class FreshnessScorer:
     """Score items based on recency."""
 
+    # Age boundaries in seconds (1, 7, 30, 90 days) and the score below each,
+    # with the last score for anything older
+    AGE_BOUNDARIES = (86400, 7 * 86400, 30 * 86400, 90 * 86400)
+    AGE_SCORES = (100.0, 90.0, 70.0, 50.0, 30.0)
+
     def __init__(self):
         """Initialize freshness scorer."""
         pass
@@ -30,12 +36,7 @@ class FreshnessScorer:
             return None
 
         try:
-            if isinstance(date_value, datetime):
-                return date_value
-            elif isinstance(date_value, str):
-                return date_parser.parse(date_value)
-            else:
-                return None
+            return parse_datetime(date_value)
         except Exception as e:
             logger.warning(f"Error parsing date '{date_value}': {e}")
             return None
@@ -50,7 +51,11 @@ class FreshnessScorer:
         Returns:
             Freshness score (0-100)
         """
-        published_date = self.parse_date(item.get('published_date'))
+        # Reuse the datetime parsed by Normalizer when present
+        if PUBLISHED_DT_FIELD in item:
+            published_date = item[PUBLISHED_DT_FIELD]
+        else:
+            published_date = self.parse_date(item.get('published_date'))
 
         if not published_date:
             # No date available - assume medium freshness
@@ -65,18 +70,8 @@ class FreshnessScorer:
         # 7-30 days: 70
         # 30-90 days: 50
         # >90 days: 30
+        score = self.AGE_SCORES[bisect_right(self.AGE_BOUNDARIES, age.total_seconds())]
 
-        if age < timedelta(days=1):
-            score = 100.0
-        elif age < timedelta(days=7):
-            score = 90.0
-        elif age < timedelta(days=30):
-            score = 70.0
-        elif age < timedelta(days=90):
-            score = 50.0
-        else:
-            score = 30.0
-
-        logger.debug(f"Freshness score for '{item.get('title', '')[:50]}...': {score} (age: {age.days} days)")
+        logger.debug("Freshness score for '%s...': %s (age: %d days)", item.get('title', '')[:50], score, age.days)
 
         return score
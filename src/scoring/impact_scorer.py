@@ -2,6 +2,7 @@
 Impact scorer for severity and affected users assessment.
 """
 from typing import Dict, Any, List
+from src.utils.keyword_matcher import KeywordMatcher
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -10,6 +11,9 @@ logger = get_logger(__name__)
 class ImpactScorer:
     """Score items based on impact and severity."""
 
+    # Stage name for counts precomputed by KeywordIndex
+    KEYWORD_STAGE = 'impact'
+
     # High-impact keywords
     HIGH_IMPACT_KEYWORDS = [
         'critical', 'severe', 'zero-day', 'widespread', 'exploit',
@@ -25,7 +29,10 @@ class ImpactScorer:
 
     def __init__(self):
         """Initialize impact scorer."""
-        pass
+        self.matcher = KeywordMatcher({
+            'high': self.HIGH_IMPACT_KEYWORDS,
+            'medium': self.MEDIUM_IMPACT_KEYWORDS
+        })
 
     def count_impact_keywords(self, text: str) -> tuple:
         """
@@ -37,12 +44,9 @@ class ImpactScorer:
         Returns:
             Tuple of (high_impact_count, medium_impact_count)
         """
-        text_lower = text.lower()
-
-        high_count = sum(1 for keyword in self.HIGH_IMPACT_KEYWORDS if keyword in text_lower)
-        medium_count = sum(1 for keyword in self.MEDIUM_IMPACT_KEYWORDS if keyword in text_lower)
+        counts = self.matcher.count(text.lower())
 
-        return high_count, medium_count
+        return counts.get('high', 0), counts.get('medium', 0)
 
     def score(self, item: Dict[str, Any]) -> float:
         """
@@ -55,14 +59,12 @@ class ImpactScorer:
             Impact score (0-100)
         """
         title = item.get('title', '')
-        content = item.get('content', '')
-        text = f"{title} {content}"
-
-        high_count, medium_count = self.count_impact_keywords(text)
+        counts = self.matcher.count_item(item, self.KEYWORD_STAGE)
+        high_count, medium_count = counts.get('high', 0), counts.get('medium', 0)
 
         # Calculate score: high impact keywords worth more
         score = min(high_count * 20 + medium_count * 10, 100)
 
-        logger.debug(f"Impact score for '{title[:50]}...': {score} (high:{high_count}, medium:{medium_count})")
+        logger.debug("Impact score for '%s...': %s (high:%d, medium:%d)", title[:50], score, high_count, medium_count)
 
         return float(score)
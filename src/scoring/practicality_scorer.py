@@ -2,6 +2,7 @@
 Practicality scorer for actionable insights assessment.
 """
 from typing import Dict, Any, List
+from src.utils.keyword_matcher import KeywordMatcher
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -10,6 +11,9 @@ logger = get_logger(__name__)
 class PracticalityScorer:
     """Score items based on actionable insights and practical value."""
 
+    # Stage name for counts precomputed by KeywordIndex
+    KEYWORD_STAGE = 'practicality'
+
     # Practical/actionable keywords
     PRACTICAL_KEYWORDS = [
         'mitigation', 'remediation', 'fix', 'patch', 'solution',
@@ -20,7 +24,7 @@ class PracticalityScorer:
 
     def __init__(self):
         """Initialize practicality scorer."""
-        pass
+        self.matcher = KeywordMatcher({'practical': self.PRACTICAL_KEYWORDS})
 
     def count_practical_keywords(self, text: str) -> int:
         """
@@ -32,9 +36,7 @@ class PracticalityScorer:
         Returns:
             Number of practical keyword matches
         """
-        text_lower = text.lower()
-        count = sum(1 for keyword in self.PRACTICAL_KEYWORDS if keyword in text_lower)
-        return count
+        return self.matcher.count(text.lower()).get('practical', 0)
 
     def score(self, item: Dict[str, Any]) -> float:
         """
@@ -47,15 +49,12 @@ class PracticalityScorer:
             Practicality score (0-100)
         """
         title = item.get('title', '')
-        content = item.get('content', '')
-        text = f"{title} {content}"
-
-        practical_count = self.count_practical_keywords(text)
+        practical_count = self.matcher.count_item(item, self.KEYWORD_STAGE).get('practical', 0)
 
         # Convert to 0-100 scale
         # Cap at 5 matches for a perfect score
         score = min(practical_count * 20, 100)
 
-        logger.debug(f"Practicality score for '{title[:50]}...': {score} ({practical_count} practical keywords)")
+        logger.debug("Practicality score for '%s...': %s (%d practical keywords)", title[:50], score, practical_count)
 
         return float(score)
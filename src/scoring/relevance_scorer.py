@@ -3,6 +3,7 @@ Relevance scorer for topical match to priority areas.
 """
 from typing import Dict, Any, List
 from src.config import Config
+from src.utils.keyword_matcher import KeywordMatcher
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -11,6 +12,9 @@ logger = get_logger(__name__)
 class RelevanceScorer:
     """Score items based on topical relevance to priority areas."""
 
+    # Stage name for counts precomputed by KeywordIndex
+    KEYWORD_STAGE = 'relevance'
+
     def __init__(self, config: Config = None):
         """
         Initialize relevance scorer.
@@ -20,6 +24,7 @@ class RelevanceScorer:
         """
         self.config = config or Config()
         self.keywords = self._load_keywords()
+        self.matcher = KeywordMatcher(self.keywords)
 
     def _load_keywords(self) -> Dict[str, List[str]]:
         """
@@ -63,15 +68,7 @@ class RelevanceScorer:
         Returns:
             Number of keyword matches found
         """
-        text_lower = text.lower()
-        match_count = 0
-
-        for topic, keyword_list in self.keywords.items():
-            for keyword in keyword_list:
-                if keyword.lower() in text_lower:
-                    match_count += 1
-
-        return match_count
+        return sum(self.matcher.count(text.lower()).values())
 
     def score(self, item: Dict[str, Any]) -> float:
         """
@@ -84,16 +81,14 @@ class RelevanceScorer:
             Relevance score (0-100)
         """
         title = item.get('title', '')
-        content = item.get('content', '')
-        text = f"{title} {content}"
 
         # Count keyword matches
-        matches = self.count_keyword_matches(text)
+        matches = sum(self.matcher.count_item(item, self.KEYWORD_STAGE).values())
 
         # Convert to 0-100 scale
         # Cap at 10 matches for a perfect score
         score = min(matches * 10, 100)
 
-        logger.debug(f"Relevance score for '{title[:50]}...': {score} ({matches} keyword matches)")
+        logger.debug("Relevance score for '%s...': %s (%d keyword matches)", title[:50], score, matches)
 
         return float(score)
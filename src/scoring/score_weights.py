@@ -1,7 +1,9 @@
 """
 Centralized scoring weight management.
 """
-from typing import Dict
+from itertools import repeat
+from operator import mul
+from typing import Dict, Iterable, List, Sequence
 from src.config import Config
 from src.utils.logger import get_logger
 
@@ -71,10 +73,37 @@ class ScoreWeights:
         Returns:
             Final weighted score (0-100)
         """
-        weighted_sum = 0.0
+        # Sum of weight * score (unknown dimensions weigh 0), looped in C
+        weights = map(self.weights.get, scores, repeat(0.0))
+        return sum(map(mul, weights, scores.values()), 0.0)
 
-        for dimension, score in scores.items():
-            weight = self.get_weight(dimension)
-            weighted_sum += weight * score
+    def weight_vector(self, dimensions: Sequence[str]) -> List[float]:
+        """
+        Get weights in a fixed dimension order.
+
+        Args:
+            dimensions: Dimension names
 
-        return weighted_sum
+        Returns:
+            Weight for each dimension, in the given order
+        """
+        return [self.get_weight(dimension) for dimension in dimensions]
+
+    def calculate_weighted_scores(self,
+                                  dimensions: Sequence[str],
+                                  rows: Iterable[Sequence[float]]) -> List[float]:
+        """
+        Calculate final weighted scores for a batch of items.
+
+        Equivalent to calculate_weighted_score per item, with the weights
+        looked up once for the whole batch.
+
+        Args:
+            dimensions: Dimension names, in the order of each row
+            rows: Each item's dimension scores (0-100)
+
+        Returns:
+            Final weighted score (0-100) for each row
+        """
+        weights = self.weight_vector(dimensions)
+        return [sum(map(mul, weights, row)) for row in rows]
@@ -1,11 +1,34 @@
 """
 Fallback summarizer using metadata extraction when LLM is unavailable.
 """
-from typing import Dict, Any
+import re
+from typing import Dict, Any, Iterator
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_SENTENCE_END_RE = re.compile(r'[.!?]')
+
+# A sentence: the shortest run of more than 20 characters ending in . ! or ?
+_MIN_SENTENCE_CHARS = 20
+
+
+def _iter_sentences(text: str) -> Iterator[str]:
+    """
+    Yield sentences from the start of text, stopping when none is left.
+
+    Equivalent to finditer(r'.{20,}?[.!?]', re.DOTALL) but linear: that
+    pattern retries from every position when no terminator follows, which
+    is quadratic on long text without punctuation.
+    """
+    start = 0
+    while True:
+        end = _SENTENCE_END_RE.search(text, start + _MIN_SENTENCE_CHARS)
+        if not end:
+            return
+        yield text[start:end.end()]
+        start = end.end()
+
 
 class FallbackSummarizer:
     """Conservative metadata-based summarization when LLM unavailable."""
@@ -30,15 +53,10 @@ class FallbackSummarizer:
 
         # Simple sentence splitting (not perfect but works for basic cases)
         sentences = []
-        current = ""
-
-        for char in text:
-            current += char
-            if char in '.!?' and len(current) > 20:
-                sentences.append(current.strip())
-                current = ""
-                if len(sentences) >= num_sentences:
-                    break
+        for sentence in _iter_sentences(text):
+            sentences.append(sentence.strip())
+            if len(sentences) == num_sentences:
+                break
 
         if sentences:
             return ' '.join(sentences)
@@ -1,22 +1,64 @@
 """
 LLM-based summarizer using Ollama API.
 """
-import json
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, List, Optional
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from src.utils.logger import get_logger
 from src.summarization.prompt_templates import PromptTemplates
 
 logger = get_logger(__name__)
 
 
+class _JsonEndScanner:
+    """Detect where the first JSON value opened by a given bracket ends in streamed text."""
+
+    def __init__(self, opening: str):
+        self.opening = opening
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str) -> bool:
+        """Consume the next piece of text; True once the JSON value is closed."""
+        for char in text:
+            if self.depth == 0:
+                # Skip any preamble before the value starts
+                if char == self.opening:
+                    self.depth = 1
+            elif self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == '\\':
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char in '{[':
+                self.depth += 1
+            elif char in '}]':
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
+
+
 class LLMSummarizer:
     """Summarize articles using local Ollama LLM."""
 
+    REQUIRED_FIELDS = frozenset({'summary', 'why_it_matters', 'practical_mitigation'})
+
     def __init__(self,
                  ollama_url: str = "http://localhost:11434",
                  model: str = "llama3.2",
-                 timeout: int = 30):
+                 timeout: int = 30,
+                 pool_size: int = 20,
+                 connect_timeout: float = 10,
+                 keep_alive: str = "30m",
+                 num_ctx: Optional[int] = 4096):
         """
         Initialize LLM summarizer.
 
@@ -24,12 +66,32 @@ class LLMSummarizer:
             ollama_url: Ollama API base URL
             model: Model name to use
             timeout: Request timeout in seconds
+            pool_size: Keep-alive connections kept to the Ollama server
+            connect_timeout: Timeout for establishing a connection, so an
+                unreachable server fails fast rather than after ``timeout``
+            keep_alive: How long Ollama keeps the model loaded after a request,
+                so it is not reloaded between articles or runs close together
+            num_ctx: Context window in tokens (None uses the server default);
+                batched prompts need more than Ollama's 2048-token default
+
+        Requests are only served in parallel if the Ollama server is started
+        with OLLAMA_NUM_PARALLEL set (SummarizerFactory reads the same
+        variable to size its request concurrency).
         """
         self.ollama_url = ollama_url
         self.model = model
         self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.keep_alive = keep_alive
+        self.num_ctx = num_ctx
         self.prompt_templates = PromptTemplates()
 
+        # Reuse connections across calls instead of reconnecting per article
+        self.session = requests.Session()
+        adapter = HTTPAdapter(max_retries=0, pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def is_available(self) -> bool:
         """
         Check if Ollama is available.
@@ -38,47 +100,105 @@ class LLMSummarizer:
             True if Ollama is running and accessible
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.ollama_url}/api/tags",
                 timeout=5
             )
             return response.status_code == 200
         except Exception as e:
-            logger.debug(f"Ollama not available: {e}")
+            logger.debug("Ollama not available: %s", e)
             return False
 
-    def _call_ollama(self, prompt: str) -> Optional[str]:
+    def _call_ollama(self, prompt: str, json_opening: str = '{',
+                     timeout: Optional[float] = None) -> Optional[str]:
         """
         Call Ollama API with prompt.
 
+        The response is streamed, and the connection is closed (which stops
+        generation) as soon as the JSON value the prompt asks for is
+        complete, so text the model adds after it is never generated.
+
         Args:
             prompt: Prompt to send
+            json_opening: Bracket opening the expected JSON value ('{' or '[')
+            timeout: Time allowed for the whole response (defaults to ``timeout``)
 
         Returns:
             Response text or None if failed
         """
+        timeout = timeout or self.timeout
         try:
-            response = requests.post(
+            # Serialize the payload straight to bytes; requests' json= would
+            # dump to str with the json module and encode it again
+            body = {
+                "model": self.model,
+                "prompt": prompt,
+                "stream": True,
+                "keep_alive": self.keep_alive
+            }
+            if self.num_ctx:
+                body["options"] = {"num_ctx": self.num_ctx}
+            payload = orjson.dumps(body)
+            response = self.session.post(
                 f"{self.ollama_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False
-                },
-                timeout=self.timeout
+                data=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=(self.connect_timeout, timeout),
+                stream=True
             )
 
-            if response.status_code == 200:
-                result = response.json()
-                return result.get('response', '')
-            else:
-                logger.error(f"Ollama API error: {response.status_code}")
-                return None
+            try:
+                if response.status_code == 200:
+                    return self._read_stream(response, json_opening, timeout)
+                else:
+                    logger.error(f"Ollama API error: {response.status_code}")
+                    return None
+            finally:
+                response.close()
 
         except Exception as e:
             logger.error(f"Error calling Ollama: {e}")
             return None
 
+    def _read_stream(self, response: requests.Response, json_opening: str,
+                     timeout: float) -> Optional[str]:
+        """
+        Collect a streamed Ollama response until its JSON value is complete.
+
+        Args:
+            response: Streaming response (newline-delimited JSON chunks)
+            json_opening: Bracket opening the expected JSON value
+            timeout: Time allowed for the whole response in seconds
+
+        Returns:
+            Response text or None if failed
+        """
+        # The read timeout now applies between chunks, so bound the whole
+        # generation separately, as the timeout did for a single response
+        deadline = time.monotonic() + timeout
+        scanner = _JsonEndScanner(json_opening)
+        parts = []
+
+        for line in response.iter_lines():
+            if not line:
+                continue
+
+            chunk = orjson.loads(line)
+            if 'error' in chunk:
+                logger.error(f"Ollama API error: {chunk['error']}")
+                return None
+
+            text = chunk.get('response', '')
+            parts.append(text)
+
+            if scanner.feed(text) or chunk.get('done'):
+                break
+            if time.monotonic() > deadline:
+                logger.error(f"Ollama response not complete after {timeout}s")
+                return None
+
+        return ''.join(parts)
+
     def _parse_json_response(self, response: str) -> Optional[Dict[str, str]]:
         """
         Parse JSON response from LLM.
@@ -90,18 +210,20 @@ class LLMSummarizer:
             Parsed dictionary or None if failed
         """
         try:
-            # Try to find JSON in response (might have extra text)
-            start = response.find('{')
-            end = response.rfind('}') + 1
+            # Try to find JSON in response (might have extra text). orjson
+            # parses bytes directly, so search and slice the encoded response
+            # rather than building an intermediate str.
+            data = response.encode('utf-8', 'ignore')
+            start = data.find(b'{')
+            end = data.rfind(b'}') + 1
 
             if start >= 0 and end > start:
-                json_str = response[start:end]
-                return json.loads(json_str)
+                return orjson.loads(data[start:end])
             else:
                 logger.warning("No JSON found in LLM response")
                 return None
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON: {e}")
             return None
 
@@ -138,10 +260,74 @@ class LLMSummarizer:
             return None
 
         # Validate required fields
-        required_fields = ['summary', 'why_it_matters', 'practical_mitigation']
-        if all(field in parsed for field in required_fields):
+        if self._has_required_fields(parsed):
             logger.info(f"LLM summarization successful for: {title[:50]}...")
             return parsed
         else:
             logger.warning(f"LLM response missing required fields for: {title[:50]}...")
             return None
+
+    def summarize_articles(self, items: List[Dict[str, Any]]) -> List[Optional[Dict[str, str]]]:
+        """
+        Summarize several articles with a single LLM request.
+
+        Args:
+            items: Items to summarize
+
+        Returns:
+            One entry per item, in order: the summary dictionary, or None if
+            the LLM gave no usable summary for that item
+        """
+        if not items:
+            return []
+
+        prompt = self.prompt_templates.summarize_articles(items)
+        # Prompt and output both grow with the article count, and so does generation time
+        response = self._call_ollama(prompt, json_opening='[', timeout=self.timeout * len(items))
+
+        if not response:
+            logger.warning(f"LLM batch summarization failed for {len(items)} articles")
+            return [None] * len(items)
+
+        parsed = self._parse_json_array_response(response)
+
+        # Summaries are matched to articles by position, so a short or long
+        # array cannot be trusted for any of them
+        if not parsed or len(parsed) != len(items):
+            logger.warning(f"Failed to parse LLM batch response for {len(items)} articles")
+            return [None] * len(items)
+
+        results = [summary if self._has_required_fields(summary) else None for summary in parsed]
+        logger.info(f"LLM batch summarization successful for {sum(r is not None for r in results)}/{len(items)} articles")
+        return results
+
+    def _parse_json_array_response(self, response: str) -> Optional[List[Any]]:
+        """
+        Parse a JSON array from an LLM response.
+
+        Args:
+            response: Raw LLM response
+
+        Returns:
+            Parsed list or None if failed
+        """
+        try:
+            data = response.encode('utf-8', 'ignore')
+            start = data.find(b'[')
+            end = data.rfind(b']') + 1
+
+            if start >= 0 and end > start:
+                parsed = orjson.loads(data[start:end])
+                if isinstance(parsed, list):
+                    return parsed
+
+            logger.warning("No JSON array found in LLM response")
+            return None
+
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON: {e}")
+            return None
+
+    def _has_required_fields(self, summary: Any) -> bool:
+        """Check that a parsed summary is a dictionary with every required field."""
+        return isinstance(summary, dict) and self.REQUIRED_FIELDS <= summary.keys()
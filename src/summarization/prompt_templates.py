@@ -1,33 +1,14 @@
 """
 Safe prompt templates for LLM summarization.
 """
-from typing import Dict, Any
+from typing import Dict, Any, List
 
-
-class PromptTemplates:
-    """Prompt templates for generating grounded summaries."""
-
-    @staticmethod
-    def summarize_article(title: str, content: str, source: str) -> str:
-        """
-        Generate prompt for article summarization.
-
-        Args:
-            title: Article title
-            content: Article content
-            source: Article source
-
-        Returns:
-            Formatted prompt
-        """
-        # Truncate content if too long (keep first 2000 chars)
-        truncated_content = content[:2000] if len(content) > 2000 else content
-
-        return f"""You are summarizing an AI security article for cybersecurity professionals.
+# Templates are built once at import and filled with str.format per call
+_SUMMARIZE_TMPL = """You are summarizing an AI security article for cybersecurity professionals.
 
 Article Title: {title}
 Source: {source}
-Content: {truncated_content}
+Content: {content}
 
 Provide a JSON response with exactly these three fields:
 
@@ -48,24 +29,96 @@ Respond ONLY with valid JSON in this format:
   "practical_mitigation": "..."
 }}"""
 
+_BATCH_ARTICLE_TMPL = """[{number}]
+Article Title: {title}
+Source: {source}
+Content: {content}"""
+
+_SUMMARIZE_BATCH_TMPL = """You are summarizing {count} AI security articles for cybersecurity professionals.
+
+{articles}
+
+For EACH of the {count} articles above, provide an object with exactly these three fields:
+
+1. "summary": 1-2 sentence summary of the article (grounded in its content)
+2. "why_it_matters": 1 sentence explaining why this matters to enterprise defenders
+3. "practical_mitigation": 1-2 actionable insights or mitigations (if applicable, otherwise "No specific mitigation provided")
+
+IMPORTANT:
+- Base each object ONLY on the content of its own article
+- If details are unclear, say "Details limited"
+- Do not hallucinate or add information not in the source
+- Keep responses concise and practical
+
+Respond ONLY with a valid JSON array of exactly {count} objects, in the same order as the articles:
+[
+  {{
+    "summary": "...",
+    "why_it_matters": "...",
+    "practical_mitigation": "..."
+  }}
+]"""
+
+_KEY_POINTS_TMPL = """Extract the most important points from this AI security content.
+
+Content: {content}
+
+List 3-5 key points as a JSON array of strings.
+
+Respond ONLY with valid JSON in this format:
+{{"key_points": ["point 1", "point 2", "point 3"]}}"""
+
+
+class PromptTemplates:
+    """Prompt templates for generating grounded summaries."""
+
     @staticmethod
-    def extract_key_points(content: str) -> str:
+    def summarize_article(title: str, content: str, source: str) -> str:
         """
-        Generate prompt for extracting key points.
+        Generate prompt for article summarization.
 
         Args:
+            title: Article title
             content: Article content
+            source: Article source
 
         Returns:
             Formatted prompt
         """
-        truncated_content = content[:1500] if len(content) > 1500 else content
+        # Truncate content if too long (keep first 2000 chars)
+        return _SUMMARIZE_TMPL.format(title=title, source=source, content=content[:2000])
 
-        return f"""Extract the most important points from this AI security content.
+    @staticmethod
+    def summarize_articles(items: List[Dict[str, Any]]) -> str:
+        """
+        Generate prompt for summarizing several articles in one request.
 
-Content: {truncated_content}
+        Args:
+            items: Items to summarize (title, content and source are used)
 
-List 3-5 key points as a JSON array of strings.
+        Returns:
+            Formatted prompt asking for a JSON array with one object per item, in order
+        """
+        articles = '\n'.join(
+            _BATCH_ARTICLE_TMPL.format(
+                number=number,
+                title=item.get('title', 'Untitled'),
+                source=item.get('source', 'Unknown'),
+                content=item.get('content', '')[:2000]
+            )
+            for number, item in enumerate(items, 1)
+        )
+        return _SUMMARIZE_BATCH_TMPL.format(count=len(items), articles=articles)
 
-Respond ONLY with valid JSON in this format:
-{{"key_points": ["point 1", "point 2", "point 3"]}}"""
+    @staticmethod
+    def extract_key_points(content: str) -> str:
+        """
+        Generate prompt for extracting key points.
+
+        Args:
+            content: Article content
+
+        Returns:
+            Formatted prompt
+        """
+        return _KEY_POINTS_TMPL.format(content=content[:1500])
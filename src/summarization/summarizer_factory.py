@@ -1,10 +1,13 @@
 """
 Summarizer factory for dispatching to LLM or fallback.
 """
-from typing import Dict, Any, List
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from src.utils.logger import get_logger
 from src.summarization.llm_summarizer import LLMSummarizer
 from src.summarization.fallback_summarizer import FallbackSummarizer
+from src.summarization.summary_cache import SummaryCache
 
 logger = get_logger(__name__)
 
@@ -12,10 +15,17 @@ logger = get_logger(__name__)
 class SummarizerFactory:
     """Factory for creating and dispatching summarizers."""
 
+    # Articles summarized per LLM request in summarize_batch; with content
+    # truncated to 2000 characters, four articles fit a 4096-token context
+    ARTICLES_PER_PROMPT = 4
+
     def __init__(self,
                  ollama_url: str = "http://localhost:11434",
                  model: str = "llama3.2",
-                 prefer_llm: bool = True):
+                 prefer_llm: bool = True,
+                 max_concurrency: Optional[int] = None,
+                 summary_cache: SummaryCache = None,
+                 articles_per_prompt: Optional[int] = None):
         """
         Initialize summarizer factory.
 
@@ -23,10 +33,19 @@ class SummarizerFactory:
             ollama_url: Ollama API URL
             model: Model to use
             prefer_llm: Try LLM first if available
+            max_concurrency: Concurrent LLM requests in summarize_batch
+                (defaults to OLLAMA_NUM_PARALLEL, or 4)
+            summary_cache: Cache of earlier LLM summaries (optional)
+            articles_per_prompt: Articles per LLM request in summarize_batch
+                (defaults to ARTICLES_PER_PROMPT; 1 sends one request per article)
         """
         self.prefer_llm = prefer_llm
+        # Match the number of requests the Ollama server runs in parallel
+        self.max_concurrency = max_concurrency or int(os.environ.get('OLLAMA_NUM_PARALLEL', 4))
         self.llm_summarizer = LLMSummarizer(ollama_url, model)
         self.fallback_summarizer = FallbackSummarizer()
+        self.summary_cache = summary_cache or SummaryCache(model)
+        self.articles_per_prompt = articles_per_prompt or self.ARTICLES_PER_PROMPT
 
         # Check LLM availability at init
         self.llm_available = self.llm_summarizer.is_available()
@@ -46,13 +65,20 @@ class SummarizerFactory:
         Returns:
             Dictionary with summary fields
         """
-        # Try LLM if preferred and available
-        if self.prefer_llm and self.llm_available:
-            result = self.llm_summarizer.summarize(item)
-            if result:
-                return result
-            else:
-                logger.info("LLM summarization failed, falling back to metadata extraction")
+        if self.prefer_llm:
+            # Reuse an earlier LLM summary of the same article (even if the LLM is down now)
+            cached = self.summary_cache.get(item)
+            if cached:
+                return cached
+
+            # Try LLM if available
+            if self.llm_available:
+                result = self.llm_summarizer.summarize(item)
+                if result:
+                    self.summary_cache.set(item, result)
+                    return result
+                else:
+                    logger.info("LLM summarization failed, falling back to metadata extraction")
 
         # Use fallback
         return self.fallback_summarizer.summarize(item)
@@ -61,33 +87,80 @@ class SummarizerFactory:
         """
         Summarize multiple items.
 
+        With the LLM available, uncached items are summarized
+        ``articles_per_prompt`` at a time in a single request each, so prompt
+        evaluation and round trips are shared; items the LLM gives no usable
+        summary for are retried individually.
+
         Args:
             items: List of items to summarize
 
         Returns:
             List of items with added summary fields
         """
-        summarized_items = []
+        if self.prefer_llm and self.llm_available:
+            size = self.articles_per_prompt
+            chunks = [items[n:n + size] for n in range(0, len(items), size)]
+
+            # LLM calls spend seconds waiting on the server, so overlap them
+            if self.max_concurrency > 1 and len(chunks) > 1:
+                workers = min(self.max_concurrency, len(chunks))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    summarized_items = [item for chunk in executor.map(self._summarize_chunk, chunks) for item in chunk]
+            else:
+                summarized_items = [item for chunk in chunks for item in self._summarize_chunk(chunk)]
+        else:
+            summarized_items = [self._summarize_into(item) for item in items]
 
-        for item in items:
-            try:
-                summary = self.summarize(item)
+        logger.info(f"Summarized {len(summarized_items)} items")
 
-                # Add summary fields to item
-                item['summary'] = summary.get('summary', '')
-                item['why_it_matters'] = summary.get('why_it_matters', '')
-                item['practical_mitigation'] = summary.get('practical_mitigation', '')
+        return summarized_items
 
-                summarized_items.append(item)
+    def _summarize_chunk(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Summarize a chunk of items with one LLM request, adding the summary fields."""
+        if len(items) == 1:
+            return [self._summarize_into(items[0])]
 
-            except Exception as e:
-                logger.error(f"Error summarizing item: {e}")
-                # Add item without summary
-                item['summary'] = "Summarization failed"
-                item['why_it_matters'] = "N/A"
-                item['practical_mitigation'] = "N/A"
-                summarized_items.append(item)
+        pending = []
+        for item in items:
+            cached = self.summary_cache.get(item)
+            if cached:
+                self._add_summary(item, cached)
+            else:
+                pending.append(item)
 
-        logger.info(f"Summarized {len(summarized_items)} items")
+        if len(pending) > 1:
+            results = self.llm_summarizer.summarize_articles(pending)
+        else:
+            results = [None] * len(pending)
 
-        return summarized_items
+        for item, result in zip(pending, results):
+            if result:
+                self.summary_cache.set(item, result)
+                self._add_summary(item, result)
+            else:
+                # Retry on its own, then fall back to metadata extraction
+                self._summarize_into(item)
+
+        return items
+
+    def _summarize_into(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Summarize an item and add the summary fields to it."""
+        try:
+            self._add_summary(item, self.summarize(item))
+
+        except Exception as e:
+            logger.error(f"Error summarizing item: {e}")
+            # Add item without summary
+            item['summary'] = "Summarization failed"
+            item['why_it_matters'] = "N/A"
+            item['practical_mitigation'] = "N/A"
+
+        return item
+
+    @staticmethod
+    def _add_summary(item: Dict[str, Any], summary: Dict[str, str]) -> None:
+        """Add summary fields to an item."""
+        item['summary'] = summary.get('summary', '')
+        item['why_it_matters'] = summary.get('why_it_matters', '')
+        item['practical_mitigation'] = summary.get('practical_mitigation', '')
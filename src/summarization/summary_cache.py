@@ -0,0 +1,78 @@
+"""
+Cache of LLM summaries keyed on normalized article text.
+"""
+import hashlib
+import re
+from typing import Dict, Any, Optional
+from src.utils.cache import FileCache
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_WORD_RE = re.compile(r'\w+')
+
+
+class SummaryCache:
+    """
+    Reuse LLM summaries for articles already summarized.
+
+    Keys ignore case, punctuation, markup-induced whitespace and source, so
+    the same article re-fetched on a later run or syndicated by another
+    feed is summarized once.
+    """
+
+    # Summaries are kept for a week; feeds rarely resurface older articles
+    TTL_SECONDS = 7 * 24 * 3600
+
+    # Matches the content the summarization prompt actually includes
+    CONTENT_CHARS = 2000
+
+    SUMMARY_FIELDS = ('summary', 'why_it_matters', 'practical_mitigation')
+
+    def __init__(self, model: str, cache: FileCache = None):
+        """
+        Initialize summary cache.
+
+        Args:
+            model: Model name (summaries from different models are kept apart)
+            cache: Backing file cache (optional)
+        """
+        self.model = model
+        self.cache = cache or FileCache(cache_dir="private/cache/summaries", ttl_seconds=self.TTL_SECONDS)
+
+    def _key(self, item: Dict[str, Any]) -> str:
+        """Hash the model and the item's normalized title and content."""
+        title = ' '.join(_WORD_RE.findall(item.get('title', '').lower()))
+        content = ' '.join(_WORD_RE.findall(item.get('content', '')[:self.CONTENT_CHARS].lower()))
+        digest = hashlib.sha256(f"{title}\n{content}".encode()).hexdigest()
+        return f"summary:{self.model}:{digest}"
+
+    def get(self, item: Dict[str, Any]) -> Optional[Dict[str, str]]:
+        """
+        Look up a cached summary for an item.
+
+        Args:
+            item: Item to summarize
+
+        Returns:
+            Cached summary fields, or None on a miss
+        """
+        # The cache only saves LLM calls, so a failing one is treated as a miss
+        try:
+            return self.cache.get(self._key(item))
+        except OSError as e:
+            logger.warning(f"Failed to read summary cache: {e}")
+            return None
+
+    def set(self, item: Dict[str, Any], summary: Dict[str, str]) -> None:
+        """
+        Store an item's LLM summary.
+
+        Args:
+            item: Summarized item
+            summary: Summary fields returned by the LLM
+        """
+        try:
+            self.cache.set(self._key(item), {field: summary[field] for field in self.SUMMARY_FIELDS})
+        except OSError as e:
+            logger.warning(f"Failed to write summary cache: {e}")
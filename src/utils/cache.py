@@ -1,36 +1,104 @@
 """Simple file-based cache with TTL."""
 
-import json
+import hashlib
 import os
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
+import orjson
+
+from .file_utils import atomic_write_bytes
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
 
 class FileCache:
-    """File-based cache with time-to-live (TTL) support."""
-
-    def __init__(self, cache_dir: str = "private/cache", ttl_seconds: int = 3600):
+    """
+    File-based cache with time-to-live (TTL) support.
+
+    Entries read or written through an instance are also kept in memory as
+    serialized bytes, so repeated hits skip the filesystem while every get()
+    still returns a fresh copy of the value. The in-memory copies are
+    bounded by total size, evicting the least recently used first; evicted
+    entries are still read from disk.
+
+    The cache directory is listed once per instance, so lookups of keys
+    that were never stored return without touching the filesystem. Entries
+    another instance writes afterwards are missed by this one, which only
+    costs recomputing them.
+    """
+
+    def __init__(self,
+                 cache_dir: str = "private/cache",
+                 ttl_seconds: int = 3600,
+                 max_memory_bytes: int = 8 * 1024 * 1024):
         """
         Initialize file cache.
 
         Args:
             cache_dir: Directory to store cache files
             ttl_seconds: Time-to-live for cache entries in seconds
+            max_memory_bytes: Budget for entries kept in memory (0 disables it)
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl_seconds = ttl_seconds
+        self.max_memory_bytes = max_memory_bytes
+        self._reset()
+
+    def _reset(self) -> None:
+        """Start with an empty memory tier and a fresh listing of the cache directory."""
+        # key -> (timestamp, entry bytes), least recently used first
+        self._memory: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._memory_lock = threading.Lock()
+        # Names of the entry files on disk
+        self._files = {entry.name for entry in os.scandir(self.cache_dir)}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The lock cannot be pickled; the copy rebuilds its own memory tier
+        return {k: v for k, v in self.__dict__.items()
+                if k not in ('_memory', '_memory_bytes', '_memory_lock', '_files')}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._reset()
+
+    def _remember(self, key: str, timestamp: float, data: bytes) -> None:
+        """Keep an entry in memory, evicting the least recently used beyond the budget."""
+        with self._memory_lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous[1])
+            self._memory[key] = (timestamp, data)
+            self._memory_bytes += len(data)
+            while self._memory_bytes > self.max_memory_bytes and self._memory:
+                _, (_, evicted) = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+    def _recall(self, key: str) -> Optional[Tuple[float, bytes]]:
+        """Look up an in-memory entry, marking it most recently used."""
+        with self._memory_lock:
+            remembered = self._memory.get(key)
+            if remembered is not None:
+                self._memory.move_to_end(key)
+            return remembered
+
+    def _forget(self, key: str) -> None:
+        """Drop an entry from memory."""
+        with self._memory_lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous[1])
 
     def _get_cache_path(self, key: str) -> Path:
         """Get file path for cache key."""
-        # Use hash to create safe filename
-        import hashlib
-        key_hash = hashlib.sha256(key.encode()).hexdigest()
+        # Use hash to create safe filename (128 bits is ample for uniqueness)
+        key_hash = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
         return self.cache_dir / f"{key_hash}.json"
 
     def get(self, key: str) -> Optional[Any]:
@@ -43,27 +111,44 @@ class FileCache:
         Returns:
             Cached value or None if not found/expired
         """
+        now = time.time()
+
+        remembered = self._recall(key)
+        if remembered is not None and now - remembered[0] <= self.ttl_seconds:
+            logger.debug("Cache hit for key: %s", key)
+            return orjson.loads(remembered[1])['value']
+
         cache_path = self._get_cache_path(key)
+        if cache_path.name not in self._files:
+            return None
 
-        if not cache_path.exists():
+        # Read without checking exists() first: one open() instead of stat + open
+        try:
+            data = cache_path.read_bytes()
+        except FileNotFoundError:
+            self._files.discard(cache_path.name)
+            self._forget(key)
             return None
 
         try:
-            with open(cache_path, 'r') as f:
-                cache_entry = json.load(f)
+            cache_entry = orjson.loads(data)
 
             # Check if expired
-            if time.time() - cache_entry['timestamp'] > self.ttl_seconds:
-                logger.debug(f"Cache expired for key: {key}")
-                cache_path.unlink()  # Delete expired entry
+            if now - cache_entry['timestamp'] > self.ttl_seconds:
+                logger.debug("Cache expired for key: %s", key)
+                self._forget(key)
+                self._files.discard(cache_path.name)
+                cache_path.unlink(missing_ok=True)  # Delete expired entry
                 return None
 
-            logger.debug(f"Cache hit for key: {key}")
+            logger.debug("Cache hit for key: %s", key)
+            self._remember(key, cache_entry['timestamp'], data)
             return cache_entry['value']
 
-        except (json.JSONDecodeError, KeyError) as e:
+        except (orjson.JSONDecodeError, KeyError) as e:
             logger.warning(f"Invalid cache file for key {key}: {e}")
-            cache_path.unlink()  # Delete corrupted entry
+            self._files.discard(cache_path.name)
+            cache_path.unlink(missing_ok=True)  # Delete corrupted entry
             return None
 
     def set(self, key: str, value: Any) -> None:
@@ -82,8 +167,13 @@ class FileCache:
         }
 
         try:
-            with open(cache_path, 'w') as f:
-                json.dump(cache_entry, f)
-            logger.debug(f"Cached value for key: {key}")
+            # Non-string keys are stringified, as the json module does
+            data = orjson.dumps(cache_entry, option=orjson.OPT_NON_STR_KEYS)
+            # Concurrent summarizer threads and an interrupted run must never
+            # leave a half-written entry for get() to discard
+            atomic_write_bytes(cache_path, data)
+            self._files.add(cache_path.name)
+            self._remember(key, cache_entry['timestamp'], data)
+            logger.debug("Cached value for key: %s", key)
         except TypeError as e:
             logger.error(f"Cannot cache non-JSON-serializable value: {e}")
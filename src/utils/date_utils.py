@@ -0,0 +1,50 @@
+"""Date parsing shared by the normalizer and scorers."""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+
+from dateutil import parser as date_parser
+
+# Item field holding the datetime parsed by Normalizer (None if the item has no usable date)
+PUBLISHED_DT_FIELD = '_published_dt'
+
+
+def parse_datetime(value: Any) -> Optional[datetime]:
+    """
+    Parse a date value to a datetime.
+
+    ISO-8601 strings (what the fetchers and Normalizer produce) go through
+    the C ``datetime.fromisoformat``, and RFC 2822 dates (raw RSS pubDate
+    values such as "Mon, 15 Jan 2024 10:00:00 GMT") through the stdlib
+    email parser; anything else falls back to dateutil.
+
+    Args:
+        value: datetime or date string
+
+    Returns:
+        Parsed datetime, or None for values that are not strings or datetimes
+
+    Raises:
+        ValueError: If a string cannot be parsed
+    """
+    if isinstance(value, datetime):
+        return value
+    if not isinstance(value, str):
+        return None
+
+    if value[:4].isdigit():
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    elif value[:3].isalpha() and value[3:4] == ',':
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            pass
+        else:
+            # "-0000" (UTC, source zone unknown) parses naive; dateutil made it aware
+            return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+    return date_parser.parse(value)
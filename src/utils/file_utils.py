@@ -0,0 +1,61 @@
+"""Atomic file writing helpers."""
+
+import contextlib
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import IO, Iterator, Union
+
+# mkstemp creates files as 0600; published outputs should get normal permissions
+_NEW_FILE_MODE = 0o644
+
+
+@contextlib.contextmanager
+def atomic_open(path: Union[str, Path], mode: str = 'wb', **kwargs) -> Iterator[IO]:
+    """
+    Open a temporary file next to ``path`` and move it into place on success.
+
+    Readers see either the previous file or the complete new one, never a
+    partial write. If the block raises, the temporary file is removed and
+    the original is left untouched. The new file keeps the permissions of
+    the one it replaces (0644 if there was none).
+
+    Args:
+        path: Destination file path
+        mode: File mode ('w' or 'wb' variants)
+        **kwargs: Extra arguments for open() (encoding, buffering, ...)
+
+    Yields:
+        Open file object for the temporary file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        file_mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        file_mode = _NEW_FILE_MODE
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        os.chmod(tmp_path, file_mode)
+        with os.fdopen(fd, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """Atomically replace ``path`` with ``data``."""
+    with atomic_open(path, 'wb') as f:
+        f.write(data)
+
+
+def atomic_write_text(path: Union[str, Path], text: str, encoding: str = 'utf-8') -> None:
+    """Atomically replace ``path`` with ``text``."""
+    with atomic_open(path, 'w', encoding=encoding) as f:
+        f.write(text)
@@ -1,6 +1,7 @@
 """Safe HTTP client with timeouts and retries."""
 
 import time
+from types import MappingProxyType
 from typing import Optional
 import requests
 from requests.adapters import HTTPAdapter
@@ -14,18 +15,28 @@ logger = get_logger(__name__)
 class SafeHTTPClient:
     """HTTP client with safety features (timeout, retries, user-agent)."""
 
-    def __init__(self, timeout: int = 30, max_retries: int = 3):
+    # Shared, read-only default headers; set on each session once
+    DEFAULT_HEADERS = MappingProxyType({
+        "User-Agent": "AI-Security-Intelligence-Bot/1.0 (Educational; +https://github.com/USERNAME/neo-notebook.github.io)"
+    })
+
+    def __init__(self,
+                 timeout: int = 30,
+                 max_retries: int = 3,
+                 pool_size: int = 10,
+                 connect_timeout: Optional[float] = None):
         """
         Initialize HTTP client.
 
         Args:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries on failure
+            pool_size: Maximum connections open per host, kept alive between requests
+            connect_timeout: Separate, shorter timeout for establishing
+                connections (optional; defaults to timeout)
         """
-        self.timeout = timeout
-        self.headers = {
-            "User-Agent": "AI-Security-Intelligence-Bot/1.0 (Educational; +https://github.com/USERNAME/neo-notebook.github.io)"
-        }
+        self.timeout = (connect_timeout, timeout) if connect_timeout else timeout
+        self.headers = self.DEFAULT_HEADERS
 
         # Setup session with retry strategy
         self.session = requests.Session()
@@ -35,9 +46,17 @@ class SafeHTTPClient:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET", "HEAD"]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # pool_block caps open sockets per host at pool_size; extra concurrent
+        # requests wait for a free connection instead of opening throwaway ones
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=True
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        self.session.headers.update(self.headers)
 
     def fetch(self, url: str, headers: Optional[dict] = None) -> requests.Response:
         """
@@ -53,17 +72,16 @@ class SafeHTTPClient:
         Raises:
             requests.RequestException: On fetch failure
         """
-        request_headers = self.headers.copy()
-        if headers:
-            request_headers.update(headers)
-
-        logger.debug(f"Fetching: {url}")
+        # requests merges per-request headers over the session's defaults
+        logger.debug("Fetching: %s", url)
         response = self.session.get(
             url,
-            headers=request_headers,
+            headers=headers,
             timeout=self.timeout,
             verify=True  # SSL verification
         )
-        response.raise_for_status()
+        # Only let requests build an HTTPError when there is one to raise
+        if response.status_code >= 400:
+            response.raise_for_status()
 
         return response
@@ -0,0 +1,188 @@
+"""Single-pass multi-keyword matching with an Aho-Corasick automaton."""
+
+import re
+from typing import Any, Dict, Hashable, Iterable, List, Set
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Item field holding per-stage counts precomputed by KeywordIndex.annotate
+KEYWORD_COUNTS_FIELD = '_keyword_counts'
+
+# Item field holding lowercased title + content, set by Normalizer
+TEXT_LOWER_FIELD = '_text_lower'
+
+
+def lowered_text(title: str, content: str) -> str:
+    """Lowercased title + content, the text every keyword stage scans."""
+    return f"{title} {content}".lower()
+
+
+def item_text(item: Dict[str, Any]) -> str:
+    """An item's lowercased title + content, reusing the normalized copy if present."""
+    text = item.get(TEXT_LOWER_FIELD)
+    if text is None:
+        text = lowered_text(item.get('title', ''), item.get('content', ''))
+    return text
+
+
+class KeywordMatcher:
+    """
+    Count distinct keyword hits per bucket in one pass over the text.
+
+    Matching is by substring, like ``keyword in text``. Each keyword
+    counts at most once per text however often it occurs. A keyword
+    listed under several buckets counts toward each of them.
+
+    Without pyahocorasick installed, a compiled regex alternation does the
+    scan instead, with the same results.
+    """
+
+    def __init__(self, keywords: Dict[Hashable, List[str]]):
+        """
+        Build the automaton.
+
+        Args:
+            keywords: Mapping of bucket name to keyword list
+        """
+        self.keywords = keywords
+        self.buckets = list(keywords)
+
+        buckets_by_keyword: Dict[str, List[Hashable]] = {}
+        for bucket, keyword_list in keywords.items():
+            for keyword in keyword_list:
+                if keyword:
+                    buckets_by_keyword.setdefault(keyword.lower(), []).append(bucket)
+
+        self._buckets_by_keyword = buckets_by_keyword
+        self._empty = not buckets_by_keyword
+        if self._empty:
+            return
+
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in buckets_by_keyword:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+        else:
+            self._automaton = None
+            self._build_pattern()
+
+    def _build_pattern(self) -> None:
+        """
+        Build the regex fallback.
+
+        A lookahead tries the keywords longest first at every position, so
+        it finds the longest keyword starting there. Any shorter keyword at
+        the same position is a prefix of that one, so each match also
+        counts the keywords it contains.
+        """
+        by_length = sorted(self._buckets_by_keyword, key=len, reverse=True)
+        self._pattern = re.compile('(?=(' + '|'.join(map(re.escape, by_length)) + '))')
+        self._contained = {
+            keyword: [other for other in by_length if other in keyword]
+            for keyword in by_length
+        }
+
+    def _matched_keywords(self, text: str) -> Set[str]:
+        """Distinct keywords occurring in ``text``."""
+        if self._automaton is not None:
+            return {keyword for _, keyword in self._automaton.iter(text)}
+
+        matched: Set[str] = set()
+        for keyword in set(self._pattern.findall(text)):
+            matched.update(self._contained[keyword])
+        return matched
+
+    def count(self, text: str) -> Dict[Hashable, int]:
+        """
+        Count matched keywords per bucket.
+
+        Args:
+            text: Lowercased text to scan
+
+        Returns:
+            Bucket name to number of distinct keywords found, for buckets
+            with at least one match, in the order buckets were given
+        """
+        if self._empty or not text:
+            return {}
+
+        counts = dict.fromkeys(self.buckets, 0)
+        for keyword in self._matched_keywords(text):
+            for bucket in self._buckets_by_keyword[keyword]:
+                counts[bucket] += 1
+
+        return {bucket: n for bucket, n in counts.items() if n}
+
+    def count_item(self, item: Dict[str, Any], stage: str = None) -> Dict[Hashable, int]:
+        """
+        Count matches in an item's title and content.
+
+        Reuses counts stored on the item by KeywordIndex.annotate for
+        ``stage`` when present, otherwise scans the item directly.
+
+        Args:
+            item: Item to scan
+            stage: Stage name the counts were indexed under (optional)
+
+        Returns:
+            Bucket name to number of distinct keywords found
+        """
+        if stage is not None:
+            precomputed = item.get(KEYWORD_COUNTS_FIELD, {}).get(stage)
+            if precomputed is not None:
+                return precomputed
+        return self.count(item_text(item))
+
+
+class KeywordIndex:
+    """
+    Fused matcher serving several keyword-matching stages in one scan.
+
+    Clustering and the keyword-based scorers each own a KeywordMatcher;
+    the index merges them so an item's text is lowercased and scanned
+    once, and each stage reads its counts back from the item.
+    """
+
+    def __init__(self, stages: Dict[str, KeywordMatcher]):
+        """
+        Build the combined automaton.
+
+        Args:
+            stages: Mapping of stage name to that stage's matcher
+        """
+        self.stages = list(stages)
+        self._matcher = KeywordMatcher({
+            (stage, bucket): keyword_list
+            for stage, matcher in stages.items()
+            for bucket, keyword_list in matcher.keywords.items()
+        })
+
+    @classmethod
+    def from_components(cls, components: Iterable[Any]) -> 'KeywordIndex':
+        """Build an index from objects exposing KEYWORD_STAGE and a matcher."""
+        return cls({
+            component.KEYWORD_STAGE: component.matcher
+            for component in components
+            if hasattr(component, 'KEYWORD_STAGE')
+        })
+
+    def annotate(self, item: Dict[str, Any]) -> Dict[str, Dict[Hashable, int]]:
+        """
+        Scan an item once and store per-stage counts on it.
+
+        Args:
+            item: Item to annotate (modified in place)
+
+        Returns:
+            Stage name to bucket counts
+        """
+        counts: Dict[str, Dict[Hashable, int]] = {stage: {} for stage in self.stages}
+        for (stage, bucket), n in self._matcher.count(item_text(item)).items():
+            counts[stage][bucket] = n
+
+        item[KEYWORD_COUNTS_FIELD] = counts
+        return counts
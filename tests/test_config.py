@@ -0,0 +1,85 @@
+"""
+Tests for configuration loading.
+"""
+import datetime
+import os
+import pytest
+from unittest.mock import patch
+from src.config import Config
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Config directory with a minimal sources file."""
+    directory = tmp_path / "config"
+    directory.mkdir()
+    (directory / "sources.yaml").write_text(
+        "sources:\n  - name: A\n    type: rss\n    url: https://example.com/a.xml\n"
+    )
+    return directory
+
+
+class TestConfig:
+    """Tests for Config loader."""
+
+    def test_loads_enabled_sources(self, config_dir, tmp_path):
+        """Test that sources are loaded from YAML."""
+        config = Config(str(config_dir), cache_dir=str(tmp_path / "cache"))
+
+        assert [s['name'] for s in config.sources] == ['A']
+
+    def test_groups_sources_by_type(self, tmp_path):
+        """Test that enabled sources are partitioned by type."""
+        directory = tmp_path / "config"
+        directory.mkdir()
+        (directory / "sources.yaml").write_text(
+            "sources:\n"
+            "  - {name: A, type: rss}\n"
+            "  - {name: B, type: arxiv}\n"
+            "  - {name: C, type: rss, enabled: false}\n"
+            "  - {name: D}\n"
+        )
+        config = Config(str(directory), cache_dir=str(tmp_path / "cache"))
+
+        assert [s['name'] for s in config.sources_by_type['rss']] == ['A']
+        assert [s['name'] for s in config.sources_by_type['arxiv']] == ['B']
+        assert [s['name'] for s in config.sources_by_type[None]] == ['D']
+
+    def test_reuses_cached_yaml_until_file_changes(self, config_dir, tmp_path):
+        """Test that unchanged YAML is served from cache and edits invalidate it."""
+        cache_dir = str(tmp_path / "cache")
+        Config(str(config_dir), cache_dir=cache_dir)
+
+        with patch('src.config.yaml.load') as mock_load:
+            config = Config(str(config_dir), cache_dir=cache_dir)
+            mock_load.assert_not_called()
+        assert [s['name'] for s in config.sources] == ['A']
+
+        sources_file = config_dir / "sources.yaml"
+        sources_file.write_text("sources:\n  - name: B\n    type: rss\n")
+        stat = sources_file.stat()
+        os.utime(sources_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        config = Config(str(config_dir), cache_dir=cache_dir)
+        assert [s['name'] for s in config.sources] == ['B']
+
+    def test_loads_when_cache_dir_is_unusable(self, config_dir, tmp_path):
+        """Test that a cache directory that cannot be created does not stop loading."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+
+        config = Config(str(config_dir), cache_dir=str(blocker / "cache"))
+
+        assert [s['name'] for s in config.sources] == ['A']
+
+    def test_does_not_cache_values_json_would_change(self, tmp_path):
+        """Test that documents with dates or non-string keys load identically when warm."""
+        directory = tmp_path / "config"
+        directory.mkdir()
+        (directory / "tags_taxonomy.yaml").write_text("tags:\n  1: x\n  since: 2024-01-01\n")
+        cache_dir = str(tmp_path / "cache")
+
+        cold = Config(str(directory), cache_dir=cache_dir).tags_taxonomy
+        warm = Config(str(directory), cache_dir=cache_dir).tags_taxonomy
+
+        assert warm == cold == {1: 'x', 'since': datetime.date(2024, 1, 1)}
@@ -0,0 +1,61 @@
+"""
+Tests for content fetchers.
+"""
+import pytest
+from unittest.mock import Mock, patch
+from src.fetchers.rss_fetcher import RSSFetcher
+from src.utils.cache import FileCache
+
+
+FEED_XML = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Feed</title>
+<item><title>Prompt injection advisory</title><link>https://example.com/1</link>
+<description>Details here.</description></item>
+</channel></rss>"""
+
+
+@pytest.fixture
+def source():
+    """Sample RSS source config."""
+    return {'name': 'Test Feed', 'type': 'rss', 'url': 'https://example.com/feed.xml'}
+
+
+class TestRSSFetcher:
+    """Tests for RSS fetcher."""
+
+    @patch('src.fetchers.rss_fetcher.SafeHTTPClient.fetch')
+    def test_fetch_parses_downloaded_feed(self, mock_fetch, source, tmp_path):
+        """Test that downloaded feed bytes are parsed into items."""
+        mock_fetch.return_value = Mock(status_code=200, headers={}, content=FEED_XML)
+        fetcher = RSSFetcher(source, cache=FileCache(cache_dir=str(tmp_path)))
+
+        items = fetcher.fetch()
+
+        assert len(items) == 1
+        assert items[0]['title'] == 'Prompt injection advisory'
+        assert items[0]['source'] == 'Test Feed'
+
+    @patch('src.fetchers.rss_fetcher.SafeHTTPClient.fetch')
+    def test_fetch_reuses_cached_items_on_not_modified(self, mock_fetch, source, tmp_path):
+        """Test that a 304 response returns cached items and sends validators."""
+        cache = FileCache(cache_dir=str(tmp_path))
+        mock_fetch.return_value = Mock(status_code=200, headers={'ETag': '"v1"'}, content=FEED_XML)
+        first = RSSFetcher(source, cache=cache).fetch()
+
+        mock_fetch.return_value = Mock(status_code=304, headers={}, content=b'')
+        with patch('src.fetchers.rss_fetcher.feedparser.parse') as mock_parse:
+            second = RSSFetcher(source, cache=cache).fetch()
+            mock_parse.assert_not_called()
+
+        assert second == first
+        assert mock_fetch.call_args[1]['headers']['If-None-Match'] == '"v1"'
+
+    def test_fetchers_share_one_default_cache(self, source):
+        """Test that fetchers built without a cache share one, so its directory is listed once."""
+        with patch('src.fetchers.rss_fetcher.FileCache') as mock_cache, \
+                patch.object(RSSFetcher, '_shared_cache', None):
+            first = RSSFetcher(source)
+            second = RSSFetcher(dict(source, url='https://example.com/other.xml'))
+
+        assert first.cache is second.cache
+        mock_cache.assert_called_once()
@@ -1,9 +1,13 @@
 """
 Integration tests for complete pipeline.
 """
+import multiprocessing
 import pytest
 import tempfile
 import json
+import requests
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from unittest.mock import Mock, patch
 from src.main import main
@@ -12,10 +16,12 @@ from src.main import main
 class TestPipelineIntegration:
     """End-to-end pipeline tests."""
 
+    @patch('src.fetchers.rss_fetcher.SafeHTTPClient.fetch')
     @patch('src.fetchers.rss_fetcher.feedparser.parse')
-    def test_complete_daily_pipeline(self, mock_parse):
+    def test_complete_daily_pipeline(self, mock_parse, mock_fetch):
         """Test complete daily pipeline with mocked feed."""
         # Mock RSS feed response
+        mock_fetch.return_value = Mock(status_code=200, headers={}, content=b'')
         mock_parse.return_value = Mock(
             entries=[
                 Mock(
@@ -44,19 +50,23 @@ class TestPipelineIntegration:
         assert 'generated_at' in brief_data
         assert 'items' in brief_data
 
-    def test_pipeline_handles_no_items(self):
+    @patch('src.fetchers.rss_fetcher.SafeHTTPClient.fetch')
+    def test_pipeline_handles_no_items(self, mock_fetch):
         """Test pipeline gracefully handles empty feed."""
-        # Run pipeline (example feeds return 0 items)
+        # Example feeds are unreachable and return 0 items
+        mock_fetch.side_effect = requests.ConnectionError("unreachable")
         result = main('daily')
 
         assert result['items_fetched'] == 0
         assert result['items_processed'] == 0
         assert result['items_unique'] == 0
 
+    @patch('src.fetchers.rss_fetcher.SafeHTTPClient.fetch')
     @patch('src.fetchers.rss_fetcher.feedparser.parse')
-    def test_pipeline_processes_multiple_sources(self, mock_parse):
+    def test_pipeline_processes_multiple_sources(self, mock_parse, mock_fetch):
         """Test pipeline handles multiple sources."""
         # Mock RSS responses
+        mock_fetch.return_value = Mock(status_code=200, headers={}, content=b'')
         mock_parse.return_value = Mock(
             entries=[
                 Mock(
@@ -128,3 +138,64 @@ class TestComponentIntegration:
         assert 'summary' in summary
         assert 'why_it_matters' in summary
         assert 'practical_mitigation' in summary
+
+    def test_fetch_sources_preserves_source_order(self):
+        """Test concurrent fetching returns items in source order."""
+        from src.main import fetch_sources
+
+        mock_fetcher = Mock()
+        mock_fetcher.side_effect = lambda source: Mock(
+            fetch=Mock(return_value=[{'title': source['name']}])
+        )
+        sources_by_type = {
+            'rss': [{'name': 'A', 'type': 'rss'}, {'name': 'C', 'type': 'rss'}],
+            'arxiv': [{'name': 'B', 'type': 'arxiv'}]
+        }
+
+        with patch.dict('src.main.FETCHERS', {'rss': mock_fetcher}):
+            items = fetch_sources(sources_by_type, max_workers=4)
+
+        assert [item['title'] for item in items] == ['A', 'C']
+
+    def test_fetch_sources_applies_callback_per_source(self):
+        """Test that each source's items are transformed as they arrive."""
+        from src.main import fetch_sources
+
+        mock_fetcher = Mock()
+        mock_fetcher.side_effect = lambda source: Mock(
+            fetch=Mock(return_value=[{'title': source['name']}])
+        )
+        sources_by_type = {'rss': [{'name': 'A'}, {'name': 'B'}]}
+        batches = []
+
+        def on_fetched(items):
+            batches.append(items)
+            return [{'title': item['title'].lower()} for item in items]
+
+        with patch.dict('src.main.FETCHERS', {'rss': mock_fetcher}):
+            items = fetch_sources(sources_by_type, max_workers=2, on_fetched=on_fetched)
+
+        assert len(batches) == 2
+        assert [item['title'] for item in items] == ['a', 'b']
+
+    def test_score_items_matches_in_process_pool(self):
+        """Test that pooled scoring gives the same scores as in-process scoring."""
+        from src.config import Config
+        from src.main import score_items
+
+        def make_items():
+            return [
+                {'title': 'Critical prompt injection exploit', 'content': 'Patch now.', 'source': 'A'},
+                {'title': 'Agent governance guide', 'content': 'Best practice for audit.', 'source': 'B'}
+            ]
+
+        config = Config()
+        sequential = score_items(make_items(), config)
+        # Spawned workers (the default outside Linux) must unpickle everything they get
+        spawn_pool = partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context('spawn'))
+        with patch('src.main.PARALLEL_SCORING_THRESHOLD', 0), \
+                patch('src.main.ProcessPoolExecutor', spawn_pool):
+            pooled = score_items(make_items(), config, max_workers=2)
+
+        assert [i['final_score'] for i in pooled] == [i['final_score'] for i in sequential]
+        assert pooled[0]['scores'] == sequential[0]['scores']
@@ -2,6 +2,7 @@
 Tests for output generators.
 """
 import pytest
+import gzip
 import json
 import tempfile
 from pathlib import Path
@@ -93,6 +94,47 @@ class TestJSONGenerator:
             assert data['item_count'] == 2
             assert 'score' in data['items'][0]  # Private includes scores
 
+    def test_private_archive_omits_internal_fields(self, sample_items):
+        """Test that underscore-prefixed working fields are not archived."""
+        sample_items[0]['_keyword_counts'] = {'impact': {'high': 1}}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "archive.json"
+            generator = JSONGenerator()
+
+            generator.generate_private_archive(sample_items, str(output_path))
+
+            with open(output_path) as f:
+                data = json.load(f)
+
+            assert '_keyword_counts' not in data['items'][0]
+
+    def test_generates_compressed_private_archive(self, sample_items):
+        """Test that .gz archives are gzip-compressed and load back."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "archive.json.gz"
+            generator = JSONGenerator()
+
+            generator.generate_private_archive(sample_items, str(output_path))
+
+            with gzip.open(output_path) as f:
+                data = json.load(f)
+            assert data['item_count'] == 2
+            assert generator.load_private_archive(str(output_path)) == data
+
+    def test_generates_empty_private_archive(self):
+        """Test private archive with no items is still valid JSON."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "archive.json"
+            generator = JSONGenerator()
+
+            generator.generate_private_archive([], str(output_path))
+
+            with open(output_path) as f:
+                data = json.load(f)
+
+            assert data['item_count'] == 0
+            assert data['items'] == []
+
     def test_generates_trends(self, sample_items):
         """Test trends generation."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -131,6 +173,20 @@ class TestHTMLGenerator:
             assert 'Test Article 2' in html
             assert 'Summary 1' in html
 
+    def test_escapes_item_fields(self, sample_items):
+        """Test that item text is HTML-escaped."""
+        sample_items[0]['title'] = '<script>alert(1)</script>'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "index.html"
+            generator = HTMLGenerator()
+
+            generator.generate_brief_page(sample_items, str(output_path))
+
+            html = output_path.read_text()
+
+            assert '<script>alert(1)</script>' not in html
+            assert '&lt;script&gt;alert(1)&lt;/script&gt;' in html
+
 
 class TestPDFGenerator:
     """Tests for PDF generator."""
@@ -175,6 +231,19 @@ class TestLinkedInDrafts:
             assert 'tone' in data['drafts'][0]
             assert 'content' in data['drafts'][0]
 
+    def test_writes_unescaped_utf8(self, sample_items):
+        """Test that emoji in drafts are written as UTF-8, not escapes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "drafts.json"
+            generator = LinkedInDrafts()
+
+            generator.generate_drafts(sample_items, str(output_path))
+
+            raw = output_path.read_text(encoding='utf-8')
+
+            assert '🔐' in raw
+            assert '\\ud83d' not in raw
+
 
 class TestPresentationPoints:
     """Tests for presentation points."""
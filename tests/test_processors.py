@@ -1,6 +1,11 @@
 """Tests for content processors module."""
 
+import os
+import random
+import subprocess
+import sys
 import pytest
+from unittest.mock import patch
 from datetime import datetime, timedelta
 from src.processors.parser import Parser
 from src.processors.normalizer import Normalizer
@@ -85,6 +90,23 @@ class TestParser:
         assert ".hidden" not in result
         assert "<style>" not in result
 
+    def test_parser_passes_plain_text_through_without_parsing(self):
+        """Test that text without tags or entities skips the HTML parser."""
+        parser = Parser()
+
+        with patch('src.processors.parser.lxml_html.fromstring') as mock_parse:
+            assert parser.parse_html("  Plain   feed\n summary ") == "Plain feed summary"
+            mock_parse.assert_not_called()
+        assert parser.parse_html("Fish &amp; chips") == "Fish & chips"
+
+    def test_parser_keeps_text_after_removed_tags(self):
+        """Test that text following a script or style element is kept and spaced."""
+        html = "<div>Before<script>var x = 1;</script>After<style>p {}</style>End</div>"
+        parser = Parser()
+
+        assert parser.parse_html(html) == "Before After End"
+        assert parser.parse_html("   <!-- comment only -->  ") == ""
+
     def test_parser_collapses_whitespace(self):
         """Test that parser handles multiple whitespaces."""
         html = "<p>Hello    \n\n\n    world</p>"
@@ -156,6 +178,16 @@ class TestNormalizer:
         assert result['content'] == 'Test content'
         assert result['source'] == 'TestSource'
 
+    def test_normalizer_precomputes_lowercased_text(self):
+        """Test that normalizer stores lowercased text for downstream matching."""
+        item = {'title': 'Prompt INJECTION', 'content': 'Jailbreak Risk', '_text_lower': 'stale'}
+        result = Normalizer().normalize(item)
+
+        assert result['_text_lower'] == 'prompt injection jailbreak risk'
+        assert result['_content_lower'] == 'jailbreak risk'
+        # Lowercased copies are reused by keyword matching
+        assert Clustering().find_cluster({**result, 'title': '', 'content': ''}) == 'prompt_injection'
+
     def test_normalizer_converts_dates_to_iso_format(self):
         """Test that normalizer converts dates to ISO format."""
         # Test with various date formats
@@ -348,6 +380,116 @@ class TestDeduplicator:
         assert 'unique_count' in result
         assert 'unique_items' in result
 
+    def test_deduplicator_lsh_matches_exhaustive_comparison(self):
+        """Test that the MinHash-LSH path finds the same duplicates as all-pairs comparison."""
+        base = ('Researchers found a critical vulnerability in popular AI systems '
+                'that allows attackers to bypass safeguards and exfiltrate data.')
+        rng = random.Random(0)
+        vocabulary = ['model', 'agent', 'policy', 'audit', 'token', 'cloud', 'patch', 'privacy',
+                      'vendor', 'latency', 'dataset', 'browser', 'kernel', 'release', 'market']
+        items = [
+            {'title': f'Unrelated story {i}', 'content': ' '.join(rng.choice(vocabulary) for _ in range(20)),
+             'url': f'https://example.com/{i}'}
+            for i in range(80)
+        ]
+        items[10] = {'title': 'Critical AI flaw', 'content': base, 'url': 'https://a.com/1'}
+        items[50] = {'title': 'Attackers bypass AI safeguards', 'content': base + ' Patch now.', 'url': 'https://b.com/1'}
+        items[70] = {'title': 'Unrelated story 3', 'content': 'Different body text.', 'url': 'https://c.com/1'}
+
+        deduplicator = Deduplicator()
+        assert len(items) >= deduplicator.LSH_MIN_ITEMS
+        result = deduplicator.deduplicate(items)
+
+        deduplicator.LSH_MIN_ITEMS = len(items) + 1
+        expected = deduplicator.deduplicate(items)
+
+        assert result == expected
+        assert result['unique_count'] == 78
+
+    def test_minhash_signature_is_independent_of_hash_seed(self):
+        """Test that MinHash signatures are reproducible across interpreter runs."""
+        script = (
+            "from src.processors.minhash_lsh import MinHashLSH; "
+            "print(MinHashLSH().signature('critical prompt injection flaw in AI agents'))"
+        )
+        signatures = {
+            subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True,
+                           env={**os.environ, 'PYTHONHASHSEED': seed}).stdout
+            for seed in ('1', '2')
+        }
+
+        assert len(signatures) == 1
+
+    def test_deduplicator_groups_duplicates_transitively(self):
+        """Test that a chain of duplicates forms one group represented by its first item."""
+        items = [
+            {'title': 'Story A', 'content': 'One', 'url': 'https://example.com/1'},
+            {'title': 'Story B', 'content': 'Two', 'url': 'https://example.com/2'},
+            {'title': 'story b', 'content': 'Three', 'url': 'https://example.com/3'},
+            {'title': 'Story A', 'content': 'Four', 'url': 'https://example.com/4'},
+        ]
+        deduplicator = Deduplicator()
+
+        # 0~3 by title, and 1~2 by title; link 2~3 as well to form a chain
+        with patch.object(deduplicator, 'find_duplicate_pairs', return_value=[(0, 3), (1, 2), (2, 3)]):
+            result = deduplicator.deduplicate(items)
+
+        assert result['unique_items'] == [items[0]]
+        assert result['duplicate_groups'] == [items]
+
+    def test_deduplicator_links_same_titles_without_pairwise_checks(self):
+        """Test that same-title items are chained in one pass and never compared pairwise."""
+        items = [
+            {'title': 'Same Story', 'content': 'One ' * 20},
+            {'title': 'Other', 'content': 'Two ' * 20},
+            {'title': ' same story ', 'content': 'Three ' * 20},
+            {'title': 'SAME STORY', 'content': 'Four ' * 20},
+        ]
+        deduplicator = Deduplicator()
+
+        with patch.object(deduplicator, 'are_duplicates', return_value=False) as mock_check:
+            pairs = deduplicator.find_duplicate_pairs(items)
+
+        assert pairs == [(0, 2), (2, 3)]
+        checked = {tuple(sorted((items.index(c.args[0]), items.index(c.args[1])))) for c in mock_check.call_args_list}
+        assert checked == {(0, 1), (1, 2), (1, 3)}
+
+    def test_deduplicator_add_streams_items(self):
+        """Test that add() reports each item's first duplicate as items arrive."""
+        body = 'Researchers found a critical vulnerability in popular AI systems that bypasses safeguards.'
+        items = [
+            {'title': 'Story A', 'content': body},
+            {'title': 'Story B', 'content': 'Unrelated report about cloud pricing changes this quarter.'},
+            {'title': 'Story C', 'content': body + ' Update.'},
+            {'title': 'story b', 'content': ''},
+        ]
+        deduplicator = Deduplicator()
+
+        assert [deduplicator.add(item) for item in items] == [0, 1, 0, 1]
+
+        # Streaming agrees with the batch result
+        batch = deduplicator.deduplicate(items)
+        assert batch['unique_items'] == [items[0], items[1]]
+
+        deduplicator.reset()
+        assert deduplicator.add(items[2]) == 0
+
+    def test_deduplicator_process_pool_matches_in_process(self):
+        """Test that verifying pairs across worker processes gives the same groups."""
+        items = [
+            {'title': 'News A', 'content': 'Content A', 'url': 'https://example.com/1'},
+            {'title': 'News B', 'content': 'Content B', 'url': 'https://example.com/2'},
+            {'title': 'news a', 'content': 'Content C', 'url': 'https://example.com/3'},
+            {'title': 'News D', 'content': 'Content D', 'url': 'https://example.com/4'},
+        ]
+        deduplicator = Deduplicator()
+        expected = deduplicator.deduplicate(items)
+
+        deduplicator.PARALLEL_VERIFY_THRESHOLD = 0
+        deduplicator.VERIFY_CHUNK_SIZE = 2
+        assert deduplicator.find_duplicate_pairs(items, max_workers=2) == [(0, 2)]
+        assert deduplicator.deduplicate(items) == expected
+
 
 # ============================================================================
 # Clustering Tests
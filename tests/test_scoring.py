@@ -3,6 +3,7 @@ Tests for the scoring system.
 """
 import pytest
 from datetime import datetime, timedelta
+from unittest.mock import patch
 from src.scoring.relevance_scorer import RelevanceScorer
 from src.scoring.credibility_scorer import CredibilityScorer
 from src.scoring.impact_scorer import ImpactScorer
@@ -116,6 +117,27 @@ class TestFreshnessScorer:
         score = scorer.score(item)
         assert score == 50
 
+    @pytest.mark.parametrize('age_days, expected', [
+        (0.5, 100), (3, 90), (10, 70), (60, 50), (100, 30), (-1, 100)
+    ])
+    def test_scores_each_age_bucket(self, age_days, expected):
+        """Test the score for each age range."""
+        scorer = FreshnessScorer()
+        item = {'title': 'Article', '_published_dt': datetime.now() - timedelta(days=age_days)}
+        assert scorer.score(item) == expected
+
+    def test_reuses_normalized_datetime(self):
+        """Test that the datetime stored by Normalizer is used without re-parsing."""
+        scorer = FreshnessScorer()
+        item = {
+            'title': 'Normalized Article',
+            'published_date': (datetime.now() - timedelta(days=100)).isoformat(),
+            '_published_dt': datetime.now()
+        }
+        with patch.object(scorer, 'parse_date') as mock_parse:
+            assert scorer.score(item) == 100
+            mock_parse.assert_not_called()
+
 
 class TestPracticalityScorer:
     """Tests for practicality scoring."""
@@ -174,3 +196,12 @@ class TestScoreWeights:
         # Should be relevance_weight * 50 + credibility_weight * 50
         # = 0.35 * 50 + 0.25 * 50 = 17.5 + 12.5 = 30
         assert 25 <= final_score <= 35
+
+    def test_batch_matches_per_item_scores(self):
+        """Test that batch weighting gives the same result as per-item weighting."""
+        weights = ScoreWeights()
+        dimensions = ['relevance', 'credibility', 'impact', 'freshness', 'practicality']
+        rows = [(80, 60, 40, 100, 20), (0, 0, 0, 0, 0), (33.3, 70, 90, 50, 10)]
+
+        expected = [weights.calculate_weighted_score(dict(zip(dimensions, row))) for row in rows]
+        assert weights.calculate_weighted_scores(dimensions, rows) == expected
@@ -1,11 +1,14 @@
 """
 Tests for summarization module.
 """
+import json
+import threading
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 from src.summarization.fallback_summarizer import FallbackSummarizer
 from src.summarization.llm_summarizer import LLMSummarizer
 from src.summarization.summarizer_factory import SummarizerFactory
+from src.summarization.summary_cache import SummaryCache
 from src.summarization.prompt_templates import PromptTemplates
 
 
@@ -47,13 +50,21 @@ class TestFallbackSummarizer:
         assert "First sentence" in result
         assert "Second sentence" in result
 
+    def test_unpunctuated_text_falls_back_to_prefix(self):
+        """Test that long text without sentence breaks is cut to 200 characters promptly."""
+        summarizer = FallbackSummarizer()
+
+        result = summarizer._extract_first_sentences("word " * 20000, 2)
+
+        assert result == ("word " * 40) + "..."
+
 
 class TestLLMSummarizer:
     """Tests for LLM summarizer."""
 
     def test_is_available_checks_connection(self):
         """Test LLM availability check."""
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.return_value.status_code = 200
 
             summarizer = LLMSummarizer()
@@ -61,7 +72,7 @@ class TestLLMSummarizer:
 
     def test_is_available_handles_connection_error(self):
         """Test LLM availability when connection fails."""
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.side_effect = Exception("Connection failed")
 
             summarizer = LLMSummarizer()
@@ -93,13 +104,14 @@ class TestLLMSummarizer:
 
         assert result is None
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_summarize_with_valid_response(self, mock_post):
         """Test successful summarization."""
         mock_post.return_value.status_code = 200
-        mock_post.return_value.json.return_value = {
-            'response': '{"summary": "Test", "why_it_matters": "Important", "practical_mitigation": "Patch"}'
-        }
+        mock_post.return_value.iter_lines.return_value = [
+            json.dumps({'response': '{"summary": "Test", "why_it_matters": "Important", ', 'done': False}).encode(),
+            json.dumps({'response': '"practical_mitigation": "Patch"}', 'done': True}).encode()
+        ]
 
         summarizer = LLMSummarizer()
         item = {
@@ -115,7 +127,38 @@ class TestLLMSummarizer:
         assert result['why_it_matters'] == 'Important'
         assert result['practical_mitigation'] == 'Patch'
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
+    def test_call_ollama_stops_reading_once_json_is_complete(self, mock_post):
+        """Test that the stream is closed after the JSON answer, skipping trailing text."""
+        consumed = []
+
+        def lines():
+            for text in ['Sure! {"summary": "Uses {braces} and \\"quotes\\"",', ' "x": [1]}', ' Anything else?']:
+                consumed.append(text)
+                yield json.dumps({'response': text, 'done': False}).encode()
+
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.iter_lines.return_value = lines()
+
+        response = LLMSummarizer()._call_ollama("prompt")
+
+        assert response == 'Sure! {"summary": "Uses {braces} and \\"quotes\\"", "x": [1]}'
+        assert len(consumed) == 2
+        mock_post.return_value.close.assert_called_once()
+
+    @patch('requests.Session.post')
+    def test_call_ollama_keeps_model_loaded(self, mock_post):
+        """Test that requests pin the model in memory and set the context window."""
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.iter_lines.return_value = []
+
+        LLMSummarizer(keep_alive="1h", num_ctx=8192)._call_ollama("prompt")
+
+        body = json.loads(mock_post.call_args[1]['data'])
+        assert body['keep_alive'] == "1h"
+        assert body['options'] == {'num_ctx': 8192}
+
+    @patch('requests.Session.post')
     def test_summarize_handles_api_error(self, mock_post):
         """Test handling of API errors."""
         mock_post.return_value.status_code = 500
@@ -131,6 +174,11 @@ class TestLLMSummarizer:
 class TestSummarizerFactory:
     """Tests for summarizer factory."""
 
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, tmp_path, monkeypatch):
+        """Keep each test's summary cache in its own directory."""
+        monkeypatch.chdir(tmp_path)
+
     @patch('src.summarization.llm_summarizer.LLMSummarizer.is_available')
     @patch('src.summarization.llm_summarizer.LLMSummarizer.summarize')
     def test_uses_llm_when_available(self, mock_summarize, mock_available):
@@ -196,6 +244,92 @@ class TestSummarizerFactory:
         assert 'summary' in results[0]
         assert 'summary' in results[1]
 
+    @patch('src.summarization.llm_summarizer.LLMSummarizer.is_available')
+    @patch('src.summarization.llm_summarizer.LLMSummarizer.summarize')
+    def test_summarize_batch_runs_llm_calls_concurrently(self, mock_summarize, mock_available):
+        """Test that batch LLM calls overlap and results keep item order."""
+        mock_available.return_value = True
+        barrier = threading.Barrier(2, timeout=5)
+
+        def summarize(item):
+            barrier.wait()  # Deadlocks unless two calls are in flight at once
+            return {'summary': item['title'], 'why_it_matters': 'W', 'practical_mitigation': 'P'}
+
+        mock_summarize.side_effect = summarize
+
+        factory = SummarizerFactory(prefer_llm=True, max_concurrency=2, articles_per_prompt=1)
+        items = [{'title': 'Item 1'}, {'title': 'Item 2'}]
+
+        results = factory.summarize_batch(items)
+
+        assert [r['summary'] for r in results] == ['Item 1', 'Item 2']
+
+    @patch('src.summarization.llm_summarizer.LLMSummarizer.is_available')
+    @patch('src.summarization.llm_summarizer.LLMSummarizer.summarize')
+    @patch('src.summarization.llm_summarizer.LLMSummarizer._call_ollama')
+    def test_summarize_batch_shares_one_request_per_chunk(self, mock_call, mock_summarize, mock_available):
+        """Test that a chunk is summarized in one request and unusable entries are retried alone."""
+        mock_available.return_value = True
+        mock_call.return_value = json.dumps([
+            {'summary': 'S1', 'why_it_matters': 'W1', 'practical_mitigation': 'P1'},
+            {'summary': 'S2'},
+            {'summary': 'S3', 'why_it_matters': 'W3', 'practical_mitigation': 'P3'}
+        ])
+        mock_summarize.return_value = {'summary': 'Single', 'why_it_matters': 'W', 'practical_mitigation': 'P'}
+
+        factory = SummarizerFactory(prefer_llm=True, articles_per_prompt=3)
+        items = [{'title': f'Item {n}', 'content': f'Content {n}.'} for n in range(1, 4)]
+
+        results = factory.summarize_batch(items)
+
+        assert [r['summary'] for r in results] == ['S1', 'Single', 'S3']
+        mock_call.assert_called_once()
+        assert mock_call.call_args.kwargs['timeout'] == 3 * factory.llm_summarizer.timeout
+        assert mock_summarize.call_count == 1
+
+    @patch('src.summarization.llm_summarizer.LLMSummarizer._call_ollama')
+    def test_summarize_articles_rejects_misaligned_array(self, mock_call):
+        """Test that a batch response with the wrong number of summaries is discarded."""
+        mock_call.return_value = 'Here you go: [{"summary": "S", "why_it_matters": "W", "practical_mitigation": "P"}]'
+
+        summarizer = LLMSummarizer()
+        items = [{'title': 'A', 'content': 'a'}, {'title': 'B', 'content': 'b'}]
+
+        assert summarizer.summarize_articles(items) == [None, None]
+
+    @patch('src.summarization.llm_summarizer.LLMSummarizer.is_available')
+    @patch('src.summarization.llm_summarizer.LLMSummarizer.summarize')
+    def test_reuses_cached_summary_for_same_article(self, mock_summarize, mock_available):
+        """Test that an article is summarized by the LLM once, even if re-fetched elsewhere."""
+        mock_available.return_value = True
+        mock_summarize.return_value = {
+            'summary': 'LLM summary',
+            'why_it_matters': 'LLM matters',
+            'practical_mitigation': 'LLM mitigation'
+        }
+
+        factory = SummarizerFactory(prefer_llm=True)
+        first = factory.summarize({'title': 'Big News', 'content': 'New exploit, found.', 'source': 'A'})
+        again = factory.summarize({'title': 'big news', 'content': 'New exploit   found', 'source': 'B'})
+
+        assert again == first
+        mock_summarize.assert_called_once()
+
+    @patch('src.summarization.llm_summarizer.LLMSummarizer.is_available')
+    @patch('src.summarization.llm_summarizer.LLMSummarizer.summarize')
+    def test_cache_errors_do_not_fail_summarization(self, mock_summarize, mock_available):
+        """Test that an unreadable or unwritable summary cache only costs the cache."""
+        mock_available.return_value = True
+        mock_summarize.return_value = {'summary': 'S', 'why_it_matters': 'W', 'practical_mitigation': 'P'}
+        broken = MagicMock()
+        broken.get.side_effect = OSError("read-only file system")
+        broken.set.side_effect = OSError("read-only file system")
+
+        factory = SummarizerFactory(prefer_llm=True, summary_cache=SummaryCache("llama3.2", cache=broken))
+        result = factory.summarize({'title': 'Big News', 'content': 'New exploit.'})
+
+        assert result['summary'] == 'S'
+
 
 class TestPromptTemplates:
     """Tests for prompt templates."""
@@ -212,6 +346,16 @@ class TestPromptTemplates:
         assert "TestSource" in prompt
         assert "JSON" in prompt
 
+    def test_summarize_articles_prompt_numbers_each_article(self):
+        """Test the batch prompt lists every article and asks for an array."""
+        prompt = PromptTemplates.summarize_articles([
+            {'title': 'First Article', 'content': 'One', 'source': 'A'},
+            {'title': 'Second Article', 'content': 'Two', 'source': 'B'}
+        ])
+
+        assert prompt.index("[1]") < prompt.index("First Article") < prompt.index("[2]") < prompt.index("Second Article")
+        assert "JSON array of exactly 2 objects" in prompt
+
     def test_truncates_long_content(self):
         """Test that long content is truncated."""
         long_content = "x" * 5000
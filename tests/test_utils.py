@@ -1,11 +1,21 @@
 import pytest
+import logging.handlers
 import os
-import tempfile
+import pickle
+import requests
+import random
+import threading
 import time
-from unittest.mock import Mock, patch
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, Mock, patch
 from src.utils.logger import get_logger
 from src.utils.http_client import SafeHTTPClient
 from src.utils.cache import FileCache
+from src.utils.file_utils import atomic_open, atomic_write_text
+from src.utils.date_utils import parse_datetime
+from src.utils.keyword_matcher import KeywordIndex, KeywordMatcher
 
 
 def test_logger_creates_instance():
@@ -15,63 +25,374 @@ def test_logger_creates_instance():
     assert logger.name == "test"
 
 
-def test_logger_logs_messages(caplog):
+def test_logger_logs_messages():
     """Test that logger can log messages."""
-    logger = get_logger("test")
-    logger.info("Test message")
-    assert "Test message" in caplog.text
+    logger = get_logger("test_utils.memory")
+    buffer = logging.handlers.MemoryHandler(capacity=16)
+    logger.addHandler(buffer)
+    logger.propagate = False
+    try:
+        logger.info("Test message")
+    finally:
+        logger.removeHandler(buffer)
+        logger.propagate = True
+
+    assert any("Test message" in record.getMessage() for record in buffer.buffer)
+
+
+def test_logger_skips_formatting_below_level():
+    """Test that disabled debug calls never format their arguments."""
+    logger = get_logger("test_disabled_debug", level="INFO")
+    argument = MagicMock()
+
+    logger.debug("Value: %s", argument)
+
+    argument.__str__.assert_not_called()
+
+
+def test_logger_does_not_format_when_filtered():
+    """Test that records dropped by a logger filter never format their arguments."""
+    logger = get_logger("test_filtered_info", level="INFO")
+    buffer = logging.handlers.MemoryHandler(capacity=16)
+    reject_all = lambda record: False  # noqa: E731
+    argument = MagicMock()
+    logger.addHandler(buffer)
+    logger.addFilter(reject_all)
+    try:
+        logger.info("Value: %s", argument)
+    finally:
+        logger.removeFilter(reject_all)
+        logger.removeHandler(buffer)
+
+    assert buffer.buffer == []
+    argument.__str__.assert_not_called()
+
+
+@pytest.fixture(scope="module")
+def http_client():
+    """One client shared by the HTTP tests; each test patches Session.get itself."""
+    return SafeHTTPClient(timeout=10)
 
 
-def test_http_client_sets_user_agent():
+def test_http_client_sets_user_agent(http_client):
     """Test that HTTP client sets proper user-agent."""
-    client = SafeHTTPClient()
-    assert "AI-Security-Intelligence" in client.headers["User-Agent"]
+    assert "AI-Security-Intelligence" in http_client.headers["User-Agent"]
+    assert http_client.session.headers["User-Agent"] == http_client.headers["User-Agent"]
 
 
+def test_http_client_headers_are_shared():
+    """Test that clients share the read-only default headers instead of copying them."""
+    first, second = SafeHTTPClient(), SafeHTTPClient()
+
+    assert first.headers is second.headers
+    with pytest.raises(TypeError):
+        first.headers["User-Agent"] = "other"
+
+
+@pytest.mark.parametrize('status, reason', [(200, 'OK'), (404, 'Not Found'), (503, 'Service Unavailable')])
 @patch('src.utils.http_client.requests.Session.get')
-def test_http_client_fetch_with_timeout(mock_get):
-    """Test that HTTP client respects timeout."""
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.text = "test content"
+def test_http_client_fetch_with_timeout(mock_get, http_client, status, reason):
+    """Test that HTTP client respects timeout and raises HTTPError for error statuses."""
+    mock_response = requests.Response()
+    mock_response.status_code = status
+    mock_response.reason = reason
+    mock_response.url = "https://example.com"
+    mock_response._content = b"test content"
     mock_get.return_value = mock_response
 
-    client = SafeHTTPClient(timeout=10)
-    response = client.fetch("https://example.com")
+    if status < 400:
+        response = http_client.fetch("https://example.com")
+        assert response.text == "test content"
+    else:
+        with pytest.raises(requests.HTTPError) as excinfo:
+            http_client.fetch("https://example.com")
+        assert excinfo.value.response is mock_response
+        kind = "Client" if status < 500 else "Server"
+        assert str(excinfo.value) == f"{status} {kind} Error: {reason} for url: https://example.com"
 
     mock_get.assert_called_once()
     assert mock_get.call_args[1]['timeout'] == 10
-    assert response.text == "test content"
 
 
-def test_cache_stores_and_retrieves():
+@patch('src.utils.http_client.requests.Session.get')
+def test_http_client_uses_separate_connect_timeout(mock_get):
+    """Test that a connect timeout is passed alongside the read timeout."""
+    mock_get.return_value.status_code = 200
+    client = SafeHTTPClient(timeout=15, connect_timeout=5)
+    client.fetch("https://example.com")
+
+    assert mock_get.call_args[1]['timeout'] == (5, 15)
+
+
+def test_http_client_reuses_pooled_session():
+    """Test that fetches go through the client's one pooled session."""
+    client = SafeHTTPClient(pool_size=16)
+
+    with patch('src.utils.http_client.requests.Session.get', autospec=True) as mock_get:
+        mock_get.return_value.status_code = 200
+        client.fetch("https://example.com/a")
+        client.fetch("https://example.com/b")
+
+    assert [call.args[0] for call in mock_get.call_args_list] == [client.session, client.session]
+
+
+def test_http_client_respects_pool_size():
+    """Test that concurrent fetches to one host never open more than pool_size connections."""
+    client_ports = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            client_ports.add(self.client_address[1])
+            time.sleep(0.01)
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = SafeHTTPClient(pool_size=4)
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            responses = list(executor.map(client.fetch, [url] * 64))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert all(response.status_code == 200 for response in responses)
+    assert len(client_ports) <= 4
+
+
+def test_cache_stores_and_retrieves(tmp_path):
     """Test that cache can store and retrieve values."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        cache = FileCache(cache_dir=tmpdir, ttl_seconds=60)
+    cache = FileCache(cache_dir=str(tmp_path), ttl_seconds=60)
 
-        cache.set("test_key", {"data": "test value"})
-        result = cache.get("test_key")
+    cache.set("test_key", {"data": "test value"})
+    result = cache.get("test_key")
 
-        assert result == {"data": "test value"}
+    assert result == {"data": "test value"}
 
 
-def test_cache_returns_none_for_missing_key():
+def test_cache_returns_none_for_missing_key(tmp_path):
     """Test that cache returns None for missing keys."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        cache = FileCache(cache_dir=tmpdir, ttl_seconds=60)
+    cache = FileCache(cache_dir=str(tmp_path), ttl_seconds=60)
 
-        result = cache.get("nonexistent")
+    result = cache.get("nonexistent")
 
-        assert result is None
+    assert result is None
 
 
-def test_cache_expires_old_entries():
+@patch('src.utils.cache.time.time')
+def test_cache_expires_old_entries(mock_time, tmp_path):
     """Test that cache expires entries after TTL."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        cache = FileCache(cache_dir=tmpdir, ttl_seconds=1)
+    cache = FileCache(cache_dir=str(tmp_path), ttl_seconds=60)
+
+    mock_time.return_value = 1000.0
+    cache.set("test_key", "test value")
+    mock_time.return_value = 1061.0
+    result = cache.get("test_key")
+
+    assert result is None
+
+
+@patch('src.utils.cache.time.time')
+def test_cache_keeps_entries_until_ttl_elapses(mock_time, tmp_path):
+    """Test that an entry exactly ttl_seconds old is still served."""
+    cache = FileCache(cache_dir=str(tmp_path), ttl_seconds=60)
+
+    mock_time.return_value = 1000.0
+    cache.set("test_key", "test value")
+    mock_time.return_value = 1060.0
+
+    assert cache.get("test_key") == "test value"
+
+
+def test_cache_miss_skips_filesystem(tmp_path):
+    """Test that keys never stored are rejected without reading from disk."""
+    FileCache(cache_dir=str(tmp_path), ttl_seconds=60).set("stored", "value")
+    cache = FileCache(cache_dir=str(tmp_path), ttl_seconds=60)
+
+    with patch('pathlib.Path.read_bytes') as mock_read:
+        for _ in range(10000):
+            assert cache.get("absent") is None
+    mock_read.assert_not_called()
+
+    assert cache.get("stored") == "value"
+
+
+def test_cache_memory_evicts_least_recently_used_by_bytes(tmp_path):
+    """Test that the in-memory tier stays within its byte budget and falls back to disk."""
+    cache = FileCache(cache_dir=str(tmp_path), ttl_seconds=60, max_memory_bytes=1024)
+    for i in range(4):
+        cache.set(f"key{i}", "x" * 300)
+    cache.get("key1")  # key1 becomes most recently used
+    cache.set("key4", "x" * 300)
+
+    assert cache._memory_bytes <= 1024
+    assert list(cache._memory) == ["key1", "key4"]
+    assert cache.get("key0") == "x" * 300
+
+
+def test_cache_set_failure_keeps_previous_entry(tmp_path):
+    """Test that an interrupted write publishes nothing and leaves the old entry readable."""
+    cache = FileCache(cache_dir=str(tmp_path), ttl_seconds=60)
+    cache.set("test_key", "first")
+
+    with patch('src.utils.file_utils.os.replace', side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            cache.set("test_key", "second")
+
+    assert cache.get("test_key") == "first"
+    assert FileCache(cache_dir=str(tmp_path), ttl_seconds=60).get("test_key") == "first"
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_cache_set_leaves_no_temp_files(tmp_path):
+    """Test that cache entries are written atomically, without leftover temp files."""
+    cache = FileCache(cache_dir=str(tmp_path), ttl_seconds=60)
+
+    cache.set("test_key", {"data": "first"})
+    cache.set("test_key", {"data": "second"})
+
+    assert cache.get("test_key") == {"data": "second"}
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_cache_survives_pickling(tmp_path):
+    """Test that a cache can be sent to worker processes and still reads its entries."""
+    cache = FileCache(cache_dir=str(tmp_path), ttl_seconds=60)
+    cache.set("test_key", {"data": "value"})
+
+    copy = pickle.loads(pickle.dumps(cache))
+
+    assert copy.get("test_key") == {"data": "value"}
+
+
+def test_cache_warm_hits_skip_disk(tmp_path):
+    """Test that repeated hits are served from memory, as fresh copies, with one clock read each."""
+    cache = FileCache(cache_dir=str(tmp_path), ttl_seconds=60)
+    cache.set("test_key", {"data": [1, 2]})
+
+    with patch('pathlib.Path.read_bytes', side_effect=AssertionError("read from disk")), \
+            patch('src.utils.cache.time.time', wraps=time.time) as mock_time:
+        for _ in range(1000):
+            result = cache.get("test_key")
+            result["data"].append(3)
+
+    assert cache.get("test_key") == {"data": [1, 2]}
+    assert mock_time.call_count == 1000
+    assert FileCache(cache_dir=str(tmp_path), ttl_seconds=60).get("test_key") == {"data": [1, 2]}
+
+
+def test_atomic_write_replaces_file(tmp_path):
+    """Test that atomic writes replace content and leave no temp files."""
+    path = os.path.join(tmp_path, "out", "page.html")
+
+    atomic_write_text(path, "first")
+    atomic_write_text(path, "second")
+
+    with open(path) as f:
+        assert f.read() == "second"
+    assert os.listdir(os.path.dirname(path)) == ["page.html"]
+
+
+def test_atomic_write_keeps_permissions(tmp_path):
+    """Test that new files are world-readable and replaced files keep their mode."""
+    path = os.path.join(tmp_path, "page.html")
+
+    atomic_write_text(path, "first")
+    assert os.stat(path).st_mode & 0o777 == 0o644
+
+    os.chmod(path, 0o640)
+    atomic_write_text(path, "second")
+    assert os.stat(path).st_mode & 0o777 == 0o640
+
+def test_atomic_open_keeps_original_on_error(tmp_path):
+    """Test that a failed write leaves the previous file intact."""
+    path = os.path.join(tmp_path, "data.json")
+    atomic_write_text(path, "original")
+
+    with pytest.raises(RuntimeError):
+        with atomic_open(path, 'w') as f:
+            f.write("partial")
+            raise RuntimeError("boom")
+
+    with open(path) as f:
+        assert f.read() == "original"
+    assert os.listdir(tmp_path) == ["data.json"]
+
+
+def test_keyword_matcher_counts_distinct_keywords_per_bucket():
+    """Test substring semantics: overlaps match, repeats count once."""
+    matcher = KeywordMatcher({
+        'agents': ['agent', 'agentic'],
+        'policy': ['Compliance', 'governance'],
+        'regulatory': ['compliance']
+    })
+
+    counts = matcher.count("agentic agent compliance compliance")
+
+    assert counts == {'agents': 2, 'policy': 1, 'regulatory': 1}
+
+
+def test_keyword_matcher_handles_no_matches():
+    """Test that unmatched and empty inputs return no buckets."""
+    matcher = KeywordMatcher({'agents': ['agent']})
+
+    assert matcher.count("nothing relevant") == {}
+    assert matcher.count("") == {}
+    assert KeywordMatcher({}).count("agent") == {}
+
+
+def test_keyword_index_serves_each_stage_from_one_scan():
+    """Test that annotated counts match per-stage scans and are reused."""
+    clusters = KeywordMatcher({'agents': ['agent'], 'injection': ['prompt injection']})
+    impact = KeywordMatcher({'high': ['critical', 'exploit'], 'medium': ['affected']})
+    index = KeywordIndex({'cluster': clusters, 'impact': impact})
+    item = {'title': 'Critical agent exploit', 'content': 'Prompt injection affected agents.'}
+
+    counts = index.annotate(item)
+
+    assert counts['cluster'] == clusters.count_item(dict(item, _keyword_counts={}))
+    assert counts['impact'] == {'high': 2, 'medium': 1}
+    with patch.object(impact, 'count') as mock_count:
+        assert impact.count_item(item, 'impact') == {'high': 2, 'medium': 1}
+        mock_count.assert_not_called()
+
+
+def test_parse_datetime_handles_iso_and_other_formats():
+    """Test the ISO fast path and the dateutil fallback agree on the result."""
+    assert parse_datetime('2024-01-15T10:00:00') == datetime(2024, 1, 15, 10, 0)
+    assert parse_datetime('2024-01-15T10:00:00Z') == datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)
+    assert parse_datetime('Mon, 15 Jan 2024 10:00:00 GMT') == datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)
+    assert parse_datetime('Mon, 15 Jan 2024 10:00:00 +0200') == datetime(2024, 1, 15, 8, 0, tzinfo=timezone.utc)
+    assert parse_datetime('Mon, 15 Jan 2024 10:00:00 -0000').utcoffset() is not None
+    assert parse_datetime('Mon, 15 Jan 2024 10:00:00 -0000') == datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)
+    assert parse_datetime('Mon, 15 Jan 2024') == datetime(2024, 1, 15)
+    assert parse_datetime(None) is None
+    with pytest.raises(ValueError):
+        parse_datetime('not a date')
+
 
-        cache.set("test_key", "test value")
-        time.sleep(2)  # Wait for expiration
-        result = cache.get("test_key")
+def test_keyword_matcher_regex_fallback_matches_automaton():
+    """Test that the regex fallback counts the same keywords as Aho-Corasick."""
+    keywords = {
+        'agents': ['agent', 'agentic', 'gent'],
+        'injection': ['prompt injection', 'injection', 'prompt'],
+        'misc': ['a.b', 'tic']
+    }
+    automaton_matcher = KeywordMatcher(keywords)
+    with patch('src.utils.keyword_matcher.ahocorasick', None):
+        regex_matcher = KeywordMatcher(keywords)
 
-        assert result is None
+    rng = random.Random(0)
+    words = ['agentic', 'agent', 'prompt', 'injection', 'a.b', 'axb', 'tic', 'x']
+    for _ in range(200):
+        text = ' '.join(rng.choice(words) for _ in range(rng.randint(0, 6)))
+        assert regex_matcher.count(text) == automaton_matcher.count(text), text